@@ -1,42 +1,56 @@
 import sys
+import pathlib
 import re
+from typing import TextIO
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, stream
+from aoc.automaton import Automaton
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2, streaming=(part1_stream, part2_stream), summable=True)
 
 
 def part1(raw: str):
-    total = 0
-    for line in raw.splitlines():
-        digits = re.findall(r"\d", line)
-        total += int(digits[0] + digits[-1])
-    return total
+    return sum(map(calibration_value, raw.splitlines()))
 
 
 def part2(raw: str):
-    digit_names = "zero one two three four five six seven eight nine".split()
-    digits = {
-        **{name: value for value, name in enumerate(digit_names)},
-        **{str(value): value for value in range(10)},
-    }
-    total = 0
-    for line in raw.splitlines():
-        first_occurrence = [
-            (line.index(digit), digit) for digit in digits if digit in line
-        ]
-        last_occurrence = [
-            (line.rindex(digit), digit) for digit in digits if digit in line
-        ]
-        _, left = min(first_occurrence)
-        _, right = max(last_occurrence)
-        total += 10 * digits[left] + digits[right]
-    return total
+    return sum(map(spelled_calibration_value, raw.splitlines()))
+
+
+def part1_stream(file: TextIO):
+    return sum(map(calibration_value, stream.lines(file)))
+
+
+def part2_stream(file: TextIO):
+    return sum(map(spelled_calibration_value, stream.lines(file)))
+
+
+DIGIT_NAMES = "zero one two three four five six seven eight nine".split()
+DIGITS = {
+    **{name: value for value, name in enumerate(DIGIT_NAMES)},
+    **{str(value): value for value in range(10)},
+}
+VALUES = list(DIGITS.values())
+# the first digit of a line is the first to end reading forwards, and the last
+# is the first to end reading the line backwards, spelled backwards
+FORWARDS = Automaton(DIGITS)
+BACKWARDS = Automaton(digit[::-1] for digit in DIGITS)
+
+
+def calibration_value(line: str) -> int:
+    digits = re.findall(r"\d", line)
+    return int(digits[0] + digits[-1])
+
+
+def spelled_calibration_value(line: str) -> int:
+    left = FORWARDS.first_match(line)
+    right = BACKWARDS.first_match(reversed(line))
+    if left is None or right is None:
+        raise ValueError(f"no digits in {line!r}")
+    return 10 * VALUES[left] + VALUES[right]
 
 
 if __name__ == "__main__":
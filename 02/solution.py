@@ -1,51 +1,158 @@
+from __future__ import annotations
 import sys
-import math
-from collections import Counter
+import re
+import pathlib
+from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, lazy, memo, stream
+
+np = lazy.module("numpy")
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2, streaming=(part1_stream, part2_stream))
+
+
+# one row per draw: game_id, draw_index, red, green, blue
+type Draws = np.ndarray
+
+GAME_ID, DRAW_INDEX, RED, GREEN, BLUE = range(5)
+MAX_CUBES = (12, 13, 14)  # red, green, blue
 
 
 def part1(raw: str):
-    MAX = Counter(red=12, green=13, blue=14)
-    total = 0
-    for game_id, draws in parse(raw):
-        if all(draw <= MAX for draw in draws):
-            total += game_id
-    return total
+    return feasible_total(parse(raw))
 
 
 def part2(raw: str):
-    total = 0
-    for game_id, draws in parse(raw):
-        first, *rest = draws
-        min_cubes = first
-        for draw in rest:
-            min_cubes |= draw
-        power = math.prod(min_cubes.values())
-        total += power
-    return total
-
-
-def parse(raw: str):
-    for line in raw.strip().splitlines():
-        left, right = line.split(":")
-        game_id = int(left.split()[1])
-        raw_draws = right.split(";")
-        draws = []
-        for raw_draw in raw_draws:
-            draw = {}
-            for part in raw_draw.split(","):
-                quantity, colour = part.split()
-                draw[colour] = int(quantity)
-            draws.append(Counter(draw))
-        yield game_id, draws
+    return power_total(parse(raw))
+
+
+def part1_stream(file: TextIO):
+    return tally(stream.lines(file)).feasible
+
+
+def part2_stream(file: TextIO):
+    return tally(stream.lines(file)).power
+
+
+def tally(lines: Iterable[str]) -> Tally:
+    totals = Tally()
+    for line in lines:
+        totals.add(line)
+    return totals
+
+
+def running_totals(lines: Iterable[str]) -> Iterator[tuple[int, int]]:
+    """Both answers so far, after each game record: (feasible id sum, power sum)."""
+    totals = Tally()
+    for line in lines:
+        totals.add(line)
+        yield totals.feasible, totals.power
+
+
+# a count and the first letter of its colour
+CUBES = re.compile(r"(\d+) ([rgb])")
+
+
+@dataclass
+class Tally:
+    """
+    Running answers over game records fed in one line at a time. Each line is
+    folded into the totals as it arrives, holding only its three per-colour
+    maxima while it's read, so the state and the cost of a line stay the same
+    however many games came before.
+    """
+
+    feasible: int = 0  # sum of the ids of the games possible with MAX_CUBES
+    power: int = 0  # sum of the powers of the games' smallest cube sets
+
+    def add(self, line: str):
+        header, _, draws = line.partition(":")
+        game_id = int(header.split()[1])
+        most = dict(r=0, g=0, b=0)
+        for count, colour in CUBES.findall(draws):
+            most[colour] = max(most[colour], int(count))
+        red, green, blue = most["r"], most["g"], most["b"]
+        max_red, max_green, max_blue = MAX_CUBES
+        if red <= max_red and green <= max_green and blue <= max_blue:
+            self.feasible += game_id
+        # a colour a game never shows plays no part in its power
+        self.power += (red or 1) * (green or 1) * (blue or 1)
+
+
+def feasible_total(draws: Draws) -> int:
+    game_ids, min_cubes = per_game_max(draws)
+    feasible = (min_cubes <= MAX_CUBES).all(axis=1)
+    return int(game_ids[feasible].sum())
+
+
+def power_total(draws: Draws) -> int:
+    _, min_cubes = per_game_max(draws)
+    # a colour a game never shows plays no part in its power
+    return int(np.where(min_cubes > 0, min_cubes, 1).prod(axis=1).sum())
+
+
+def per_game_max(draws: Draws) -> tuple[np.ndarray, np.ndarray]:
+    """Each game's id and the most cubes of each colour in any of its draws."""
+    if not len(draws):
+        return np.zeros(0, dtype=np.int64), np.zeros((0, 3), dtype=np.int64)
+    # every game's draws are together, starting from draw 0
+    firsts = np.flatnonzero(draws[:, DRAW_INDEX] == 0)
+    cubes = draws[:, RED : BLUE + 1]
+    return draws[firsts, GAME_ID], np.maximum.reduceat(cubes, firsts, axis=0)
+
+
+@memo.per_input
+def parse(raw: str) -> Draws:
+    return draw_table(raw.encode())
+
+
+def draw_table(text: bytes) -> Draws:
+    """
+    Every number in the text, its kind told by the byte after it: a colon for
+    a game's id, else a space and the first letter of a colour. Each count
+    goes in the row of its draw, found by counting the newlines and semicolons
+    before it, and in its colour's column.
+    """
+    chars = np.frombuffer(text, dtype=np.uint8)
+    starts, stops, values = numbers(chars)
+    last = len(chars) - 1
+    is_id = chars[np.minimum(stops, last)] == ord(":")
+    line = np.searchsorted(np.flatnonzero(chars == ord("\n")), starts)
+    semicolons = np.searchsorted(np.flatnonzero(chars == ord(";")), starts)
+    is_count = ~is_id
+    # the game of each count is the one whose id is on the same line
+    game = np.searchsorted(line[is_id], line[is_count])
+    draw_index = semicolons[is_count] - semicolons[is_id][game]
+    # one more at every semicolon and newline, so it differs between draws
+    draw_key = semicolons[is_count] + line[is_count]
+    keys, row = np.unique(draw_key, return_inverse=True)
+    column = np.zeros(256, dtype=np.int64)
+    column[[ord("r"), ord("g"), ord("b")]] = RED, GREEN, BLUE
+    draws = np.zeros((len(keys), 5), dtype=np.int64)
+    draws[row, GAME_ID] = values[is_id][game]
+    draws[row, DRAW_INDEX] = draw_index
+    colour = column[chars[np.minimum(stops[is_count] + 1, last)]]
+    draws[row, colour] = values[is_count]
+    return draws
+
+
+def numbers(chars: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """The start, stop and value of every run of digits in `chars`."""
+    digit = (chars >= ord("0")) & (chars <= ord("9"))
+    edges = np.diff(digit.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1)
+    lengths = stops - starts
+    values = np.zeros(len(starts), dtype=np.int64)
+    for offset in range(int(lengths.max(initial=0))):
+        longer = lengths > offset
+        values[longer] = values[longer] * 10 + chars[starts[longer] + offset] - ord("0")
+    return starts, stops, values
 
 
 if __name__ == "__main__":
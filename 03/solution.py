@@ -1,15 +1,14 @@
 import sys
+import pathlib
 import re
 from dataclasses import dataclass
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, memo
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Coord = complex
@@ -34,24 +33,26 @@ class Entity:
 
 
 def part1(raw: str):
-    entities = set(parse_entities(raw))
-    numbers = set(filter(Entity.is_number, entities))
-    symbols = entities - numbers
-    entity_at = {coord: entity for entity in entities for coord in entity.coords()}
-    adjacent_entities = {
-        entity: {
-            entity_at[neighbour]
-            for coord in entity.coords()
-            for neighbour in neighbours(coord)
-            if neighbour in entity_at
-        }
-        for entity in entities
-    }
+    numbers, symbols, adjacent_entities = analyse(raw)
     parts = {number for number in numbers if adjacent_entities[number] & symbols}
     return sum(int(part.string) for part in parts)
 
 
 def part2(raw: str):
+    numbers, symbols, adjacent_entities = analyse(raw)
+    total = 0
+    for symbol in symbols:
+        adjacent_numbers = adjacent_entities[symbol] & numbers
+        if len(adjacent_numbers) == 2:
+            a, b = map(int, adjacent_numbers)
+            total += a * b
+    return total
+
+
+@memo.per_input
+def analyse(
+    raw: str,
+) -> tuple[set[Entity], set[Entity], dict[Entity, set[Entity]]]:
     entities = set(parse_entities(raw))
     numbers = set(filter(Entity.is_number, entities))
     symbols = entities - numbers
@@ -65,13 +66,7 @@ def part2(raw: str):
         }
         for entity in entities
     }
-    total = 0
-    for symbol in symbols:
-        adjacent_numbers = adjacent_entities[symbol] & numbers
-        if len(adjacent_numbers) == 2:
-            a, b = map(int, adjacent_numbers)
-            total += a * b
-    return total
+    return numbers, symbols, adjacent_entities
 
 
 def parse_entities(schematic: str):
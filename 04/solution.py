@@ -1,50 +1,70 @@
 import sys
-import re
+import pathlib
 from collections import Counter
 from collections.abc import Iterable
+from typing import TextIO
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, memo, parsing, stream
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2, streaming=(part1_stream, part2_stream))
 
 
 type Card = tuple[list[int], list[int]]
 
 
 def part1(raw: str):
+    return points(parse(raw))
+
+
+def part2(raw: str):
+    return total_cards(parse(raw))
+
+
+def part1_stream(file: TextIO):
+    return points(parse_lines(stream.lines(file)))
+
+
+def part2_stream(file: TextIO):
+    return total_cards(parse_lines(stream.lines(file)))
+
+
+def points(cards: Iterable[Card]) -> int:
     total = 0
-    for need, have in parse(raw):
+    for need, have in cards:
         matching = (Counter(need) & Counter(have)).total()
         if matching:
             total += 1 << (matching - 1)
     return total
 
 
-def part2(raw: str):
+def total_cards(cards: Iterable[Card]) -> int:
+    # only copies of cards still to come are kept, so memory does not grow
+    # with the number of cards
+    total = 0
     copies = Counter()
-    for card_id, card in enumerate(parse(raw)):
-        copies[card_id] += 1
+    for card_id, card in enumerate(cards):
+        count = copies.pop(card_id, 0) + 1
+        total += count
         need, have = card
         matching = (Counter(need) & Counter(have)).total()
         for offset in range(matching):
-            copies[card_id + offset + 1] += copies[card_id]
-    return copies.total()
+            copies[card_id + offset + 1] += count
+    return total + copies.total()
 
 
+@memo.per_input
 def parse(raw: str) -> Iterable[Card]:
-    for line in raw.strip().splitlines():
-        _, card = line.split(":")
-        left, right = card.split("|")
-        yield ints(left), ints(right)
+    yield from parse_lines(raw.strip().splitlines())
 
 
-def ints(string: str) -> list[int]:
-    return list(map(int, re.findall(r"\d+", string)))
+def parse_lines(lines: Iterable[str]) -> Iterable[Card]:
+    for line in lines:
+        _, card = line.split(":")
+        left, right = card.split("|")
+        yield parsing.ints(left), parsing.ints(right)
 
 
 if __name__ == "__main__":
@@ -1,17 +1,16 @@
 import sys
-import re
+import pathlib
 import bisect
-import math
-from itertools import batched
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, lazy, memo, parsing
+from aoc.intervals import IntervalSet
+
+np = lazy.module("numpy")
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 def part1(raw: str):
@@ -24,14 +23,14 @@ def part1(raw: str):
 
 def part2(raw: str):
     seeds, mappings = parse(raw)
-    ranges = [(start, start + length) for (start, length) in batched(seeds, 2)]
+    starts, lengths = np.array(seeds, dtype=np.int64).reshape(-1, 2).T
+    ranges = IntervalSet(starts, starts + lengths).coalesce()
     for mapping in mappings:
-        ranges = sort_and_coalesce(apply_to_ranges(mapping, ranges))
-    return min(ranges)[0]
+        ranges = apply_to_ranges(mapping, ranges).coalesce()
+    return ranges.min()
 
 
 type Mapping = tuple[list[int], list[int]]
-type Range = tuple[int, int]
 
 
 def apply(m: Mapping, x: int) -> int:
@@ -40,43 +39,19 @@ def apply(m: Mapping, x: int) -> int:
     return new[idx] + x - old[idx]
 
 
-def apply_to_ranges(m: Mapping, ranges: list[Range]) -> list[Range]:
-    old, new = m
-    result = []
-    for start, stop in ranges:
-        start_idx = bisect.bisect_right(old, start) - 1
-        stop_idx = bisect.bisect_left(old, stop)
-        for idx in range(start_idx, stop_idx):
-            dest = new[idx] + start - old[idx]
-            bound = old[idx + 1] if idx + 1 < len(old) else math.inf
-            length = min(stop, bound) - start
-            result.append((dest, dest + length))
-            start += length
-    for start, stop in result:
-        assert start < stop
-    return result
-
-
-def sort_and_coalesce(ranges: list[Range]) -> list[Range]:
-    result = []
-    if not ranges:
-        return result
-    range_iter = iter(sorted(ranges))
-    curr_start, curr_stop = next(range_iter)
-    for start, stop in range_iter:
-        if start > curr_stop:
-            result.append((curr_start, curr_stop))
-            curr_start, curr_stop = start, stop
-        else:
-            curr_stop = stop
-    result.append((curr_start, curr_stop))
-    return result
+def apply_to_ranges(m: Mapping, ranges: IntervalSet) -> IntervalSet:
+    """Cut the ranges wherever the mapping's offset changes, then move each piece."""
+    old, new = (np.array(bounds, dtype=np.int64) for bounds in m)
+    pieces = ranges.split(old)
+    idx = np.searchsorted(old, pieces.starts, side="right") - 1
+    return pieces.shift(new[idx] - old[idx])
 
 
+@memo.per_input
 def parse(raw: str) -> tuple[list[int], list[Mapping]]:
     paras = raw.strip().split("\n\n")
     first, *rest = paras
-    seeds = list(ints(first))
+    seeds = parsing.ints(first)
     mappings = [parse_mapping(para) for para in rest]
     return seeds, mappings
 
@@ -93,7 +68,7 @@ def parse_mapping(raw: str) -> Mapping:
     """
     old = [-1]
     new = [-1]
-    ranges = [ints(line) for line in raw.strip().splitlines()]
+    ranges = [parsing.ints(line) for line in raw.strip().splitlines()]
     ranges = list(filter(None, ranges))
     ranges.sort(key=lambda r: r[1])
     for dest, source, length in ranges:
@@ -109,9 +84,5 @@ def parse_mapping(raw: str) -> Mapping:
     return (old, new)
 
 
-def ints(string: str) -> list[int]:
-    return list(map(int, re.findall(r"\d+", string)))
-
-
 if __name__ == "__main__":
     raise SystemExit(main())
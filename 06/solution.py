@@ -1,15 +1,13 @@
 import sys
-import re
+import pathlib
 import math
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, parsing
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 def part1(raw: str):
@@ -34,13 +32,9 @@ def max_and_min_time(time, distance):
     return math.ceil(x - y), math.floor(x + y)
 
 
-def ints(string: str) -> list[int]:
-    return list(map(int, re.findall(r"\d+", string)))
-
-
 def parse(raw: str) -> list[tuple[int, int]]:
     times, distances = raw.strip().splitlines()
-    return list(zip(ints(times), ints(distances)))
+    return list(zip(parsing.ints(times), parsing.ints(distances)))
 
 
 if __name__ == "__main__":
@@ -1,14 +1,13 @@
 import sys
+import pathlib
 from collections import Counter
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, memo
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Hand = str
@@ -30,6 +29,7 @@ def part2(raw: str):
     return sum(rank * hand_bid[hand] for rank, hand in enumerate(ranked_hands, start=1))
 
 
+@memo.per_input
 def parse(raw: str) -> dict[Hand, Bid]:
     hand_bid = {}
     for line in raw.strip().splitlines():
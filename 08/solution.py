@@ -1,16 +1,16 @@
 import sys
+import pathlib
 import re
 from itertools import cycle
 from functools import reduce
+from collections.abc import Callable
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, cycles, memo
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Instructions = str
@@ -33,27 +33,23 @@ def part1(raw: str):
 def part2(raw: str):
     instructions, network = parse(raw)
     starting_positions = [node for node in network if node.endswith("A")]
+    step = walker(instructions, network)
+    names = list(network)
     goal_cycles = []
     for position in starting_positions:
-        last_seen = {}
-        steps = 0
+        start = names.index(position)
+        loop = cycles.find(start, step)
+        # walk the run-up and the cycle once more, holding just one state
         goal_step = None
-        start_of_cycle = None
-        for instr_no, instruction in cycle(enumerate(instructions)):
-            if (instr_no, position) in last_seen:
-                start_of_cycle = last_seen[instr_no, position]
-                break
-            if position.endswith("Z"):
+        state = start
+        for steps in range(loop.start + loop.length):
+            if names[state % len(names)].endswith("Z"):
                 assert goal_step is None  # not actually true for the example
                 goal_step = steps
-            last_seen[instr_no, position] = steps
-            position = network[position]["LR".index(instruction)]
-            steps += 1
+            state = step(state)
         assert goal_step is not None
-        assert start_of_cycle is not None
-        assert goal_step >= start_of_cycle
-        cycle_length = steps - start_of_cycle
-        goal_cycles.append((goal_step, cycle_length))
+        assert goal_step >= loop.start
+        goal_cycles.append((goal_step, loop.length))
     goal_steps, cycle_lengths = zip(*goal_cycles)
     common_offset = min(goal_steps)
     remainders = [goal_step - common_offset for goal_step in goal_steps]
@@ -61,6 +57,26 @@ def part2(raw: str):
     return reduce(crt, congruences)[0] + common_offset
 
 
+def walker(instructions: Instructions, network: Network) -> Callable[[int], int]:
+    """
+    One step of a walk whose state is the number of the next instruction and
+    the node, as one integer: instruction number * number of nodes + node.
+    """
+    names = {name: number for number, name in enumerate(network)}
+    lefts = [names[left] for left, right in network.values()]
+    rights = [names[right] for left, right in network.values()]
+    turns = [lefts if instruction == "L" else rights for instruction in instructions]
+    nodes = len(names)
+    wrap = len(instructions) * nodes
+
+    def step(state: int) -> int:
+        instr_no, node = divmod(state, nodes)
+        return (state - node + nodes) % wrap + turns[instr_no][node]
+
+    return step
+
+
+@memo.per_input
 def parse(raw: str) -> tuple[Instructions, Network]:
     network = {}
     instructions, graph = raw.strip().split("\n\n")
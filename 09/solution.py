@@ -1,21 +1,43 @@
 from __future__ import annotations
 import sys
+import pathlib
 from itertools import pairwise
 from collections.abc import Iterable
-import re
+from typing import TextIO
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, lazy, memo, parsing, stream
+
+np = lazy.module("numpy")
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2, streaming=(part1_stream, part2_stream))
 
 
 def part1(raw: str):
     sequences = parse(raw)
+    if sequences is None:
+        return total_extrapolated(parse_lines(raw.splitlines()))
+    return sum_of_next_values(sequences)
+
+
+def part2(raw: str):
+    sequences = parse(raw)
+    if sequences is None:
+        return total_hindcasted(parse_lines(raw.splitlines()))
+    return sum_of_previous_values(sequences)
+
+
+def part1_stream(file: TextIO):
+    return total_extrapolated(parse_lines(stream.lines(file)))
+
+
+def part2_stream(file: TextIO):
+    return total_hindcasted(parse_lines(stream.lines(file)))
+
+
+def total_extrapolated(sequences: Iterable[tuple[int, ...]]) -> int:
     total = 0
     for sequence in sequences:
         extrapolated = extrapolate(sequence)
@@ -23,8 +45,7 @@ def part1(raw: str):
     return total
 
 
-def part2(raw: str):
-    sequences = parse(raw)
+def total_hindcasted(sequences: Iterable[tuple[int, ...]]) -> int:
     total = 0
     for sequence in sequences:
         hindcasted = extrapolate(sequence, backwards=True)
@@ -32,12 +53,50 @@ def part2(raw: str):
     return total
 
 
-def parse(raw: str) -> list[tuple[int, ...]]:
-    return [tuple(ints(line)) for line in raw.strip().splitlines()]
+def sum_of_next_values(sequences: np.ndarray) -> int:
+    # each next value is the sum of the last values of every row of differences
+    total = 0
+    while sequences.size and sequences.any():
+        total += int(sequences[:, -1].sum())
+        sequences = np.diff(sequences, axis=1)
+    return total
+
+
+def sum_of_previous_values(sequences: np.ndarray) -> int:
+    # and each previous value is first - (first' - (first'' - ...))
+    total = 0
+    sign = 1
+    while sequences.size and sequences.any():
+        total += sign * int(sequences[:, 0].sum())
+        sequences = np.diff(sequences, axis=1)
+        sign = -sign
+    return total
+
+
+@memo.per_input
+def parse(raw: str) -> np.ndarray | None:
+    """
+    One sequence per row, or None if the lines hold different numbers of values
+    or any value is too big for int64, which leaves them to exact Python ints.
+    """
+    data = np.frombuffer(raw.strip().encode(), dtype=np.uint8)
+    newline = data == ord("\n")
+    # each value starts where a run of bytes other than spaces and newlines does
+    solid = ~newline & (data != ord(" "))
+    starts = solid & ~np.r_[False, solid[:-1]]
+    lines = int(newline.sum()) + 1
+    counts = np.bincount(np.cumsum(newline)[starts], minlength=lines)
+    if (counts != counts[0]).any():
+        return None
+    try:
+        values = parsing.int_array(raw, negatives=True)
+    except OverflowError:
+        return None
+    return values.reshape(lines, -1)
 
 
-def ints(string: str) -> Iterable[int]:
-    return map(int, re.findall(r"-?[0-9]+", string))
+def parse_lines(lines: Iterable[str]) -> Iterable[tuple[int, ...]]:
+    return (tuple(parsing.ints(line, negatives=True)) for line in lines)
 
 
 def extrapolate(sequence: Iterable[int], *, backwards: bool = False) -> tuple[int, ...]:
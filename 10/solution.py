@@ -1,16 +1,19 @@
 from __future__ import annotations
 import sys
-from itertools import combinations, chain, islice
+import pathlib
+from itertools import chain, islice
 from collections import deque
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, graph, lazy, memo
+from aoc.graph import Graph
+from aoc.grid import Grid, Mask
+
+np = lazy.module("numpy")
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Vector = tuple[int, int]
@@ -65,69 +68,75 @@ def part2(raw: str):
         if exit_direction == rotate_90_cw(entry_direction):
             left_turns -= 1
     assert left_turns in (-4, 4)
+    walls = to_mask(pipes, loop)
     if left_turns == 4:
-        return len(flood_fill(left_edge, set(loop)))
+        return int(flood_fill(to_mask(pipes, left_edge), walls).sum())
     if left_turns == -4:
-        return len(flood_fill(right_edge, set(loop)))
+        return int(flood_fill(to_mask(pipes, right_edge), walls).sum())
 
 
-def parse(raw: str) -> tuple[Cell, dict[Cell, Pipe]]:
-    pipes = {
-        (r, c): char
-        for r, line in enumerate(raw.strip().splitlines())
-        for c, char in enumerate(line)
-    }
-    (start,) = (cell for cell, pipe in pipes.items() if pipe == "S")
+@memo.per_input
+def parse(raw: str) -> tuple[Cell, Grid]:
+    pipes = Grid.parse(raw)
+    (start,) = pipes.extract("S")
     return start, pipes
 
 
-def get_loop(start: Cell, pipes: dict[Cell, Pipe]) -> tuple[Cell, ...]:
-    paths = [[start, neighbour] for neighbour in connections(start, pipes)]
-    assert paths
-    while paths:
-        for path_a, path_b in combinations(paths, 2):
-            assert len(path_a) == len(path_b)
-            if path_a[-1] == path_b[-1]:
-                return *path_a, *reversed(path_b[1:-1])
-            if path_a[-1] in connections(path_b[-1], pipes):
-                return *path_a, *reversed(path_b[1:])
-        remaining_paths = []
-        for path in paths:
-            extensions = connections(path[-1], pipes) - {path[-2]}
-            if not extensions:
-                continue
-            assert len(extensions) == 1
-            (extension,) = extensions
-            remaining_paths.append(path + [extension])
-        paths = remaining_paths
+def to_mask(grid: Grid, cells) -> Mask:
+    mask = np.zeros(grid.shape, dtype=bool)
+    rows, cols = np.array([cell for cell in cells if cell in grid]).T
+    mask[rows, cols] = True
+    return mask
+
+
+@memo.per_input
+def get_loop(start: Cell, pipes: Grid) -> tuple[Cell, ...]:
+    connected = pipe_graph(pipes)
+    offsets, targets = connected.offsets.tolist(), connected.targets.tolist()
+    origin = pipes.flat(*start)
+    for first in targets[offsets[origin] : offsets[origin + 1]]:
+        loop = [origin]
+        previous, tile = origin, first
+        while tile != origin:
+            loop.append(tile)
+            ends = targets[offsets[tile] : offsets[tile + 1]]
+            if len(ends) != 2:
+                break  # a dead end, or a branch off the start that isn't the loop
+            previous, tile = tile, ends[ends[0] == previous]
+        else:
+            rows, cols = pipes.unflat(np.array(loop))
+            return tuple(zip(rows.tolist(), cols.tolist()))
     assert False, "no loop found"
 
 
-def add(u: Vector, v: Vector) -> Vector:
-    return (u[0] + v[0], u[1] + v[1])
-
-
-def sub(u: Vector, v: Vector) -> Vector:
-    return (u[0] - v[0], u[1] - v[1])
+def pipe_graph(pipes: Grid) -> Graph:
+    """Edges between every pair of adjacent cells whose pipes join up, by flat index."""
+    rows, cols = np.indices(pipes.shape)
+    sources, targets = [], []
+    for direction in (N, S, W, E):
+        opposite = (-direction[0], -direction[1])
+        leaving = pipes.mask(pipes_towards(direction))
+        entering = pipes.mask(pipes_towards(opposite))
+        r, c = rows + direction[0], cols + direction[1]
+        joined = leaving & pipes.in_bounds(r, c)
+        joined[joined] = entering[r[joined], c[joined]]
+        sources.append(pipes.flat(rows[joined], cols[joined]))
+        targets.append(pipes.flat(r[joined], c[joined]))
+    return Graph.from_edges(
+        pipes.height * pipes.width, np.concatenate(sources), np.concatenate(targets)
+    )
 
 
-def neighbours(cell: Cell | set[Cell]) -> set[Cell]:
-    if isinstance(cell, set):
-        return set.union(*map(neighbours, cell))
-    return {add(cell, direction) for direction in (N, E, S, W)}
+def pipes_towards(direction: Vector) -> str:
+    return "".join(pipe for pipe, ends in PIPES.items() if direction in ends)
 
 
-def pipe_ends(cell: Cell, pipe: Pipe) -> set[Cell]:
-    return {add(cell, direction) for direction in PIPES[pipe]}
+def add(u: Vector, v: Vector) -> Vector:
+    return (u[0] + v[0], u[1] + v[1])
 
 
-def connections(cell: Cell, pipes: dict[Cell, Pipe]) -> set[Cell]:
-    return {
-        end
-        for end in pipe_ends(cell, pipes[cell])
-        if end in pipes
-        if cell in pipe_ends(end, pipes[end])
-    }
+def sub(u: Vector, v: Vector) -> Vector:
+    return (u[0] - v[0], u[1] - v[1])
 
 
 def rotate_90_cw(vector: Vector) -> Vector:
@@ -140,13 +149,12 @@ def rotate_90_ccw(vector: Vector) -> Vector:
     return (-b, a)
 
 
-def flood_fill(sources: set[Cell], walls: set[Cell]) -> set[Cell]:
-    filled = set()
-    frontier = sources - walls
-    while frontier:
-        filled |= frontier
-        frontier = neighbours(frontier) - walls - filled
-    return filled
+def flood_fill(sources: Mask, walls: Mask) -> Mask:
+    open_ground = graph.from_mask(~walls)
+    filled = np.zeros(walls.size, dtype=bool)
+    for layer in graph.bfs_layers(open_ground, np.flatnonzero(sources & ~walls)):
+        filled[layer] = True
+    return filled.reshape(walls.shape)
 
 
 def sliding_window(iterable, n):
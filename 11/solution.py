@@ -1,15 +1,14 @@
 import sys
+import pathlib
 from bisect import bisect
 from itertools import combinations
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, memo
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Vector = tuple[int, int]
@@ -28,6 +27,7 @@ def part2(raw: str):
     )
 
 
+@memo.per_input
 def parse(raw: str) -> set[Galaxy]:
     return {
         (r, c)
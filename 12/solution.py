@@ -1,19 +1,18 @@
 from __future__ import annotations
 import sys
+import pathlib
 from collections.abc import Iterable
 from dataclasses import dataclass
 from itertools import combinations
 from collections import Counter
 import re
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, memo, parsing
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 def part1(raw: str):
@@ -32,10 +31,11 @@ def part2(raw: str):
     return total
 
 
+@memo.per_input
 def parse(raw: str):
     for line in raw.strip().splitlines():
         prefix, suffix = line.split()
-        yield prefix, ints(suffix)
+        yield prefix, tuple(parsing.ints(suffix))
 
 
 def count_arrangements(string: str, blocks: Iterable[int]) -> int:
@@ -59,9 +59,5 @@ def count_arrangements(string: str, blocks: Iterable[int]) -> int:
     return sum(count for index, count in counts.items() if "#" not in string[index:])
 
 
-def ints(string: str) -> tuple[int, ...]:
-    return tuple(map(int, re.findall(r"[0-9]+", string)))
-
-
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -1,14 +1,12 @@
 import sys
-import re
+import pathlib
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, memo
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 def part1(raw: str):
@@ -31,6 +29,7 @@ def part2(raw: str):
     return total
 
 
+@memo.per_input
 def parse(raw: str):
     for para in raw.strip().split("\n\n"):
         yield para.splitlines()
@@ -76,12 +75,5 @@ def transpose(pattern: list[str]) -> list[str]:
     return ["".join(column) for column in zip(*pattern)]
 
 
-def ints(string: str, *, negatives: bool = False) -> list[int]:
-    if negatives:
-        return list(map(int, re.findall(r"-?[0-9]+", string)))
-    else:
-        return list(map(int, re.findall(r"[0-9]+", string)))
-
-
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -1,16 +1,18 @@
 from __future__ import annotations
 import sys
-from dataclasses import dataclass, replace
-from itertools import count
+import hashlib
+import pathlib
+from dataclasses import dataclass
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, cycles, lazy
+from aoc.grid import Grid
+
+np = lazy.module("numpy")
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Vector = tuple[int, int]
@@ -32,103 +34,88 @@ def part1(raw: str):
 
 def part2(raw: str):
     rocks = Rocks.parse(raw)
-    seen = {}
-    history = []
-    final_state = None
-    for cycle in count(0):
-        if rocks in seen:
-            loop_start = seen[rocks]
-            loop_length = cycle - loop_start
-            final_state = history[
-                loop_start + (1_000_000_000 - loop_start) % loop_length
-            ]
-            break
-        seen[rocks] = cycle
-        history.append(rocks)
-        for direction in (N, W, S, E):
-            rocks = rocks.shift(direction)
-    assert final_state is not None
+    # spins are dear, so remember a digest of each state rather than re-spin
+    final_state = cycles.state_at(
+        rocks, spin, 1_000_000_000, key=Rocks.fingerprint, remember=True
+    )
     return final_state.load()
 
 
-@dataclass(frozen=True)
+def spin(rocks: Rocks) -> Rocks:
+    for direction in (N, W, S, E):
+        rocks = rocks.shift(direction)
+    return rocks
+
+
+# rotations (np.rot90 k) that bring each edge of the grid to the top
+TO_NORTH = {N: 0, W: -1, S: 2, E: 1}
+
+
+@dataclass(frozen=True, eq=False)
 class Rocks:
-    height: int
-    width: int
-    rounded: frozenset[Coord]
-    square: frozenset[Coord]
+    grid: Grid
 
     @classmethod
     def parse(cls, raw: str) -> Rocks:
-        lines = raw.strip().splitlines()
-        return Rocks(
-            height=len(lines),
-            width=len(lines[0]),
-            rounded=frozenset(
-                {
-                    (row, col)
-                    for row, line in enumerate(lines)
-                    for col, char in enumerate(line)
-                    if char == "O"
-                }
-            ),
-            square=frozenset(
-                {
-                    (row, col)
-                    for row, line in enumerate(lines)
-                    for col, char in enumerate(line)
-                    if char == "#"
-                }
-            ),
-        )
+        return Rocks(grid=Grid.parse(raw))
+
+    @property
+    def height(self) -> int:
+        return self.grid.height
+
+    @property
+    def width(self) -> int:
+        return self.grid.width
 
     def shift(self, direction: Vector):
         if direction not in (N, S, E, W):
             raise ValueError()
-        key = {
-            N: lambda rock: +rock[0],
-            S: lambda rock: -rock[0],
-            W: lambda rock: +rock[1],
-            E: lambda rock: -rock[1],
-        }[direction]
-        new_locations = set()
-        for rock in sorted(self.rounded, key=key):
-            while True:
-                shifted = add(rock, direction)
-                if (
-                    shifted in new_locations
-                    or shifted in self.square
-                    or not self.in_bounds(shifted)
-                ):
-                    break
-                rock = shifted
-            new_locations.add(rock)
-        return replace(self, rounded=frozenset(new_locations))
+        k = TO_NORTH[direction]
+        tilted = tilt_north(np.rot90(self.grid.cells, k))
+        return Rocks(grid=Grid(np.ascontiguousarray(np.rot90(tilted, -k))))
 
     def in_bounds(self, coord: Coord) -> bool:
-        row, col = coord
-        return 0 <= row < self.height and 0 <= col < self.width
+        return coord in self.grid
 
     def load(self) -> int:
-        return sum(self.height - row for (row, col) in self.rounded)
+        rows, cols = np.nonzero(self.grid.mask("O"))
+        return int((self.height - rows).sum())
 
     def char(self, coord: Coord) -> str:
-        if coord in self.rounded:
-            return "O"
-        elif coord in self.square:
-            return "#"
-        else:
-            return "."
+        return self.grid[coord]
 
-    def __str__(self) -> str:
-        return "\n".join(
-            "".join(self.char((row, col)) for col in range(self.width))
-            for row in range(self.height)
-        )
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Rocks):
+            return NotImplemented
+        return self.grid == other.grid
 
+    def __hash__(self) -> int:
+        return hash(self.grid)
 
-def add(u: Vector, v: Vector) -> Vector:
-    return (u[0] + v[0], u[1] + v[1])
+    def fingerprint(self) -> bytes:
+        return hashlib.blake2b(self.grid.cells.tobytes(), digest_size=16).digest()
+
+    def __str__(self) -> str:
+        return str(self.grid)
+
+
+def tilt_north(cells: np.ndarray) -> np.ndarray:
+    """
+    Roll every rounded rock north until it meets a square rock or the edge.
+    Each column splits into segments at the square rocks; a segment holding
+    k rounded rocks ends up with them in its first k cells.
+    """
+    height, width = cells.shape
+    square = cells == ord("#")
+    rounded = cells == ord("O")
+    rows = np.arange(height)[:, None]
+    segment_start = np.maximum.accumulate(np.where(square, rows, -1), axis=0) + 1
+    segment = np.cumsum(square, axis=0) + np.arange(width) * (height + 1)
+    rounded_in_segment = np.bincount(segment[rounded], minlength=width * (height + 1))
+    tilted = np.full_like(cells, ord("."))
+    tilted[square] = ord("#")
+    tilted[~square & (rows - segment_start < rounded_in_segment[segment])] = ord("O")
+    return tilted
 
 
 if __name__ == "__main__":
@@ -1,17 +1,17 @@
 import sys
+import pathlib
 import re
+from collections.abc import Iterable
+from typing import TextIO
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, stream
 
 assert sys.version_info >= (3, 7)
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2, streaming=(part1_stream, part2_stream))
 
 
 def part1(raw: str):
@@ -19,6 +19,10 @@ def part1(raw: str):
     return sum(map(hash_, parts))
 
 
+def part1_stream(file: TextIO):
+    return sum(map(hash_, steps(file)))
+
+
 def hash_(string: str) -> int:
     current = 0
     for char in string:
@@ -29,7 +33,20 @@ def hash_(string: str) -> int:
 
 
 def part2(raw: str):
-    instructions = raw.strip().split(",")
+    return focusing_power(raw.strip().split(","))
+
+
+def part2_stream(file: TextIO):
+    return focusing_power(steps(file))
+
+
+def steps(file: TextIO) -> Iterable[str]:
+    for step in stream.split(file, ","):
+        if step := step.strip():
+            yield step
+
+
+def focusing_power(instructions: Iterable[str]) -> int:
     boxes = [{} for boxnum in range(256)]
     for instruction in instructions:
         match = re.match(r"([a-z]+)([=-])([0-9]*)", instruction)
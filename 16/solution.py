@@ -1,20 +1,24 @@
+from __future__ import annotations
 import sys
 import re
+import pathlib
+import functools
 from collections.abc import Iterable
 from enum import Enum
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, lazy, memo
+from aoc.grid import Grid, Mask
+
+np = lazy.module("numpy")
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Vector = complex
-type Coord = Vector
+type Coord = tuple[int, int]
 
 
 class Dir(complex, Enum):
@@ -26,21 +30,20 @@ class Dir(complex, Enum):
 
 def part1(raw: str):
     grid = parse(raw)
-    start_pos = 0 - 1j
-    start_vel = 0 + 1j
-    return len(energized(grid, start_pos, start_vel))
+    start_pos = (0, -1)
+    start_vel = Dir.E
+    return int(energized(grid, start_pos, start_vel).sum())
 
 
 def part2(raw: str):
     grid = parse(raw)
-    height = int(max(coord.real for coord in grid))
-    width = int(max(coord.imag for coord in grid))
-    west_edge = [row - 1j for row in range(height)]
-    east_edge = [row + 1j for row in range(height)]
-    north_edge = [-1 + col * 1j for col in range(width)]
-    south_edge = [+1 + col * 1j for col in range(width)]
-    return max(
-        len(energized(grid, start_pos, start_vel))
+    height, width = grid.shape
+    west_edge = [(row, -1) for row in range(height)]
+    east_edge = [(row, width) for row in range(height)]
+    north_edge = [(-1, col) for col in range(width)]
+    south_edge = [(height, col) for col in range(width)]
+    starts = [
+        (start_pos, start_vel)
         for edge, start_vel in (
             (west_edge, Dir.E),
             (east_edge, Dir.W),
@@ -48,31 +51,59 @@ def part2(raw: str):
             (south_edge, Dir.N),
         )
         for start_pos in edge
-    )
-
-
-def parse(raw: str) -> dict[Coord, str]:
-    return {
-        row + col * 1j: char
-        for row, line in enumerate(raw.strip().splitlines())
-        for col, char in enumerate(line)
-    }
-
-
-def energized(
-    grid: dict[Coord, str], start_pos: Vector, start_vel: Vector
-) -> set[Coord]:
-    beams = {(start_pos, start_vel)}
-    seen = set()
-    while beams:
-        seen |= beams
-        beams = {
-            (pos + vel, new_vel)
-            for pos, vel in beams
-            if pos + vel in grid
-            for new_vel in deflect(vel, grid[pos + vel])
-        } - seen
-    return {pos for (pos, vel) in seen if pos in grid}
+    ]
+    return max(energized_counts(grid, starts))
+
+
+@memo.per_input
+def parse(raw: str) -> Grid:
+    return Grid.parse(raw)
+
+
+def energized(grid: Grid, start_pos: Coord, start_vel: Vector) -> Mask:
+    return energized_many(grid, [(start_pos, start_vel)])[0]
+
+
+def energized_counts(grid: Grid, starts: list[tuple[Coord, Vector]]) -> Iterable[int]:
+    """
+    Cells energized from each start, traced as many starts at a time as fit in
+    MAX_STATES, so memory stays a few copies of the grid however many starts.
+    """
+    height, width = grid.shape
+    batch_size = max(1, MAX_STATES // (height * width * len(DIRS)))
+    for first in range(0, len(starts), batch_size):
+        batch = energized_many(grid, starts[first : first + batch_size])
+        yield from batch.sum(axis=(1, 2)).tolist()
+
+
+def energized_many(grid: Grid, starts: list[tuple[Coord, Vector]]) -> np.ndarray:
+    """
+    Trace the beams from every start at once. A beam state is (start, cell,
+    outgoing direction) and the whole frontier is advanced together; `seen`
+    holds one flag per state. Returns one energized mask per start.
+    """
+    height, width = grid.shape
+    steps, deflections = beam_tables()
+    seen = np.zeros((len(starts), height * width, len(DIRS)), dtype=bool)
+    sources = np.arange(len(starts))
+    rows = np.array([pos[0] for pos, vel in starts])
+    cols = np.array([pos[1] for pos, vel in starts])
+    dirs = np.array([DIRS.index(vel) for pos, vel in starts])
+    while len(dirs):
+        rows = rows + steps[dirs, 0]
+        cols = cols + steps[dirs, 1]
+        inside = grid.in_bounds(rows, cols)
+        sources, rows, cols = sources[inside], rows[inside], cols[inside]
+        new_dirs = deflections[grid.cells[rows, cols], dirs[inside]]
+        cells = sources * (height * width) + grid.flat(rows, cols)
+        states = (cells[:, None] * len(DIRS) + new_dirs)[new_dirs >= 0]
+        states = np.unique(states)
+        states = states[~seen.flat[states]]
+        seen.flat[states] = True
+        cells, dirs = np.divmod(states, len(DIRS))
+        sources, cells = np.divmod(cells, height * width)
+        rows, cols = grid.unflat(cells)
+    return seen.any(axis=2).reshape(len(starts), height, width)
 
 
 def deflect(vel: Vector, char: str) -> Iterable[Vector]:
@@ -90,5 +121,26 @@ def deflect(vel: Vector, char: str) -> Iterable[Vector]:
             assert False
 
 
+DIRS = list(Dir)
+
+# beam states flagged at once, across every start traced together
+MAX_STATES = 1 << 22
+
+
+@functools.cache
+def beam_tables() -> tuple[np.ndarray, np.ndarray]:
+    """
+    The (row, col) step of each direction index, and the outgoing direction
+    indices for each (cell byte, incoming direction index), -1 padded.
+    """
+    steps = np.array([(int(d.real), int(d.imag)) for d in DIRS])
+    deflections = np.full((256, len(DIRS), 2), -1, dtype=np.int64)
+    for char in "./\\|-":
+        for i, vel in enumerate(DIRS):
+            for j, new_vel in enumerate(deflect(vel, char)):
+                deflections[ord(char), i, j] = DIRS.index(new_vel)
+    return steps, deflections
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -2,6 +2,10 @@ from collections.abc import Iterable
 from itertools import tee, islice, chain, pairwise
 import re
 import sys
+import pathlib
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli
 
 Vector = complex
 
@@ -17,12 +21,7 @@ R, D, L, U = +1, -1j, -1, +1j
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 def part1(raw: str):
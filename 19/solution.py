@@ -1,13 +1,12 @@
-import sys, math, re
+import sys, re, pathlib
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, memo
+from aoc.intervals import Boxes
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Cond = tuple[str, str, int]
@@ -15,7 +14,8 @@ type Rule = tuple[Cond | None, str]
 type Workflow = list[Rule]
 type WorkflowTable = dict[str, Workflow]
 type Part = dict[str, int]
-type PartSet = dict[str, range]
+
+AXES = "xmas"
 
 
 def part1(raw: str):
@@ -26,12 +26,11 @@ def part1(raw: str):
 
 def part2(raw: str):
     workflows, parts = parse(raw)
-    every_combination = dict(
-        x=range(1, 4001), m=range(1, 4001), a=range(1, 4001), s=range(1, 4001)
-    )
+    every_combination = Boxes.cube(len(AXES), 1, 4001)
     return count_acceptable(workflows, "in", every_combination)
 
 
+@memo.per_input
 def parse(raw: str) -> tuple[WorkflowTable, list[Part]]:
     raw_workflows, raw_parts = raw.split("\n\n")
     workflows = {}
@@ -83,37 +82,56 @@ def is_acceptable(workflows: WorkflowTable, part: Part) -> bool:
     return name == "A"
 
 
-def count_acceptable(
-    workflows: WorkflowTable,
-    name: str,
-    partset: PartSet,
-) -> int:
-    if name == "A":
-        return math.prod(len(range_) for range_ in partset.values())
-    if name == "R":
-        return 0
-    total = 0
-    workflow = workflows[name]
-    for rule in workflow:
-        cond, dest = rule
-        if cond is None:
-            total += count_acceptable(workflows, dest, partset)
-            break
-        axis, op, value = cond
-        range_ = partset[axis]
-        if op == "<":
-            lower = range(range_.start, min(range_.stop, value))
-            upper = range(max(range_.start, value), range_.stop)
-            total += count_acceptable(workflows, dest, {**partset, axis: lower})
-            partset = {**partset, axis: upper}
-        elif op == ">":
-            lower = range(range_.start, min(range_.stop, value + 1))
-            upper = range(max(range_.start, value + 1), range_.stop)
-            total += count_acceptable(workflows, dest, {**partset, axis: upper})
-            partset = {**partset, axis: lower}
-        else:
-            assert False
-    return total
+def count_acceptable(workflows: WorkflowTable, name: str, partset: Boxes) -> int:
+    """
+    Sends boxes of parts through the workflows, visiting each workflow once,
+    after every workflow that leads to it: the boxes that reach it from all of
+    them are split by each rule at once, and those satisfying it move on
+    together to the rule's destination.
+    """
+    waiting: dict[str, list[Boxes]] = {name: [partset]}
+    for name in topological_order(workflows, name):
+        if name not in waiting:
+            continue
+        boxes = Boxes.concatenate(waiting.pop(name))
+        if name in ("A", "R"):
+            waiting[name] = [boxes]
+            continue
+        for cond, dest in workflows[name]:
+            if cond is None:
+                waiting.setdefault(dest, []).append(boxes)
+                break
+            axis, op, value = cond
+            if op == "<":
+                matched, boxes = boxes.split(AXES.index(axis), value)
+            elif op == ">":
+                boxes, matched = boxes.split(AXES.index(axis), value + 1)
+            else:
+                assert False
+            if len(matched):
+                waiting.setdefault(dest, []).append(matched)
+            if not len(boxes):
+                break
+    return sum(boxes.volume() for boxes in waiting.get("A", []))
+
+
+def topological_order(workflows: WorkflowTable, start: str) -> list[str]:
+    """Workflows reachable from `start`, each after every workflow leading to it."""
+    order = []
+    visited = set()
+    stack = [(start, False)]
+    while stack:
+        name, finished = stack.pop()
+        if finished:
+            order.append(name)
+            continue
+        if name in visited:
+            continue
+        visited.add(name)
+        stack.append((name, True))
+        for _, dest in workflows.get(name, ()):
+            stack.append((dest, False))
+    return order[::-1]
 
 
 if __name__ == "__main__":
@@ -1,16 +1,15 @@
 import sys
+import pathlib
 import re
 import collections
 import math
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, memo
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Module = tuple[str, list[str]]
@@ -32,9 +31,15 @@ def part1(raw: str):
 
 
 def part2(raw: str):
-    print(to_dot(raw))
-    ...  # look at graph
+    # Each module off the broadcaster starts a chain of flip-flops counting
+    # button presses in binary, and the chain's conjunction reads the bits
+    # wired to it: once they're all set it resets the counter and signals rx's
+    # feed. So each counter comes round after the number those wires spell,
+    # and rx first gets a low pulse on the least common multiple of them all.
+    # (to_dot draws the wiring, for inputs that don't follow this pattern.)
     modules = parse(raw)
+    (feed,) = source_graph(modules)["rx"]
+    assert modules[feed][0] == "&", "rx should be fed by one conjunction"
     result = 1
     for starting_node in modules["broadcaster"][1]:
         conjunction = next(
@@ -52,7 +57,6 @@ def part2(raw: str):
             if not successors:
                 break
             (node,) = successors
-        print(starting_node, number)
         result = math.lcm(result, number)
     return result
 
@@ -112,6 +116,7 @@ def source_graph(modules: dict[str, Module]) -> dict[str, set[str]]:
     return dict(sources)
 
 
+@memo.per_input
 def parse(raw: str) -> dict[str, Module]:
     modules = {}
     for line in raw.strip().splitlines():
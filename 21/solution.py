@@ -1,25 +1,27 @@
+from __future__ import annotations
 import sys
-import numpy as np
+import pathlib
+
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, graph, lazy, memo, render
+from aoc.grid import Grid, Mask
+
+np = lazy.module("numpy")
 
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
-type Vector = complex
-type Coord = Vector
+type Coord = tuple[int, int]
 
 
 def part1(raw: str):
     grid = parse(raw)
-    (start,) = extract(grid, "S")
-    visualise(grid, possible_locations(grid, start, steps=6))
-    return len(possible_locations(grid, start, steps=6))
+    (start,) = grid.extract("S")
+    locations = possible_locations(grid, start, steps=6)
+    visualise(grid, locations)
+    return int(locations.sum())
 
 
 P2_STEPS = 26501365
@@ -27,15 +29,16 @@ P2_STEPS = 26501365
 
 def part2(raw: str):
     grid = parse(raw)
-    height, width = dimensions(grid)
+    height, width = grid.shape
     x0 = P2_STEPS % height
     x1 = x0 + height
     x2 = x1 + height
     tiled = tile(grid, 7, 7)
-    (start,) = extract(tiled, "S")
-    y0 = len(possible_locations(tiled, start, steps=x0))
-    y1 = len(possible_locations(tiled, start, steps=x1))
-    y2 = len(possible_locations(tiled, start, steps=x2))
+    (start,) = tiled.extract("S")
+    steps_to = steps_from(tiled, start, limit=x2)
+    y0 = int(reachable_in(steps_to, x0).sum())
+    y1 = int(reachable_in(steps_to, x1).sum())
+    y2 = int(reachable_in(steps_to, x2).sum())
     A = np.array(
         [
             [x0**2, x0, 1],
@@ -48,92 +51,56 @@ def part2(raw: str):
     return a * P2_STEPS**2 + b * P2_STEPS + c
 
 
-def tile(grid, m, n):
-    height, width = dimensions(grid)
+def tile(grid: Grid, m: int, n: int) -> Grid:
+    height, width = grid.shape
     assert m % 2 == 1
     assert n % 2 == 1
-    tiled_grid = {
-        coord + height * i + width * j * 1j: "." if char == "S" else char
-        for i in range(m)
-        for j in range(n)
-        for coord, char in grid.items()
-    }
-    for start in extract(grid, "S"):
-        tiled_grid[start + m // 2 * height + n // 2 * width * 1j] = "S"
+    tiled_grid = grid.tile(m, n)
+    tiled_grid.cells[tiled_grid.mask("S")] = ord(".")
+    for r, c in grid.extract("S"):
+        tiled_grid[r + m // 2 * height, c + n // 2 * width] = "S"
     return tiled_grid
 
 
-def possible_locations(grid: dict[Coord, str], start: Coord, steps: int) -> set[Coord]:
-    navigable = extract(grid, ".") | extract(grid, "S")
-    locations = {start}
-    for step in range(steps):
-        locations = neighbors(locations) & navigable
-    return locations
-
+def possible_locations(grid: Grid, start: Coord, steps: int) -> Mask:
+    return reachable_in(steps_from(grid, start, limit=steps), steps)
 
-def distance(a: Coord, b: Coord, grid: dict[Coord, str]) -> int:
-    navigable = extract(grid, ".") | extract(grid, "S")
-    positions = {a}
-    steps = 0
-    while b not in positions:
-        positions = neighbors(positions) & navigable
-        steps += 1
-    return steps
 
+def steps_from(grid: Grid, start: Coord, limit: int | None = None) -> np.ndarray:
+    """The fewest steps from `start` to each plot, or graph.UNREACHED, by cell."""
+    garden = graph.from_mask(grid.mask(".S"))
+    steps_to = graph.distances(garden, [grid.flat(*start)], limit=limit)
+    return steps_to.reshape(grid.shape)
 
-def dimensions(grid: dict[Coord, str]) -> tuple[int, int]:
-    height = int(1 + max(coord.real for coord in grid))
-    width = int(1 + max(coord.imag for coord in grid))
-    return height, width
 
+def reachable_in(steps_to: np.ndarray, steps: int) -> Mask:
+    """Plots the elf can end on after exactly `steps`, stepping back and forth."""
+    return (0 <= steps_to) & (steps_to <= steps) & (steps_to % 2 == steps % 2)
 
-def parse(raw: str) -> dict[Coord, str]:
-    return {
-        r + c * 1j: char
-        for r, line in enumerate(raw.strip().splitlines())
-        for c, char in enumerate(line)
-    }
 
+def distance(a: Coord, b: Coord, grid: Grid) -> int:
+    return int(steps_from(grid, a)[b])
 
-def neighbors(coords: Coord | set[Coord]) -> set[Coord]:
-    if isinstance(coords, set):
-        return set.union(*map(neighbors, coords))
-    else:
-        return {coords + direction for direction in (+1, -1, +1j, -1j)}
 
+@memo.per_input
+def parse(raw: str) -> Grid:
+    return Grid.parse(raw)
 
-def extract(grid: dict[Coord, str], target: str) -> set[Coord]:
-    return {coord for coord, tile in grid.items() if tile == target}
 
+def visualise(grid: Grid, filled: Mask, fillchar="O"):
+    shown = grid.copy()
+    shown.cells[filled] = ord(fillchar)
+    print(shown)
 
-def visualise(grid: dict[Coord, str], filled: set[Coord], fillchar="O"):
-    height, width = dimensions(grid)
-    for r in range(height):
-        for c in range(width):
-            coord = r + c * 1j
-            if coord in filled:
-                print(fillchar, end="")
-            else:
-                print(grid[coord], end="")
-        print()
 
+def save_image(grid: Grid, filled: Mask, path: str):
+    """Write a .png or .ppm image of the garden, with `filled` plots in blue."""
+    render.save(path, to_image(grid, filled))
 
-def save_image(grid, filled, name):
-    with open(f"{name}.ppm", "w") as file:
-        file.write(to_ppm(grid, filled))
 
-
-def to_ppm(grid, filled):
-    height, width = dimensions(grid)
-    fill_colour = "0 0 255"
-    colour = {".": "255 255 255", "#": "0 0 0", "S": "0 255 0"}
-    return f"P3 {width} {height} 255\n" + "\n".join(
-        " ".join(
-            fill_colour if r + c * 1j in filled else colour[grid[r + c * 1j]]
-            for c in range(width)
-        )
-        for r in range(height)
-    )
+def to_image(grid: Grid, filled: Mask) -> render.Image:
+    palette = {".": render.WHITE, "#": render.BLACK, "S": render.GREEN}
+    return render.overlay(render.paint(grid, palette), filled, render.BLUE)
 
 
 if __name__ == "__main__":
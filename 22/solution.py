@@ -1,16 +1,17 @@
 import sys
+import pathlib
 import re
 from collections.abc import Iterable
 from collections import defaultdict, deque
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, lazy, memo, render
+
+np = lazy.module("numpy")
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Vector = tuple[int, int, int]
@@ -19,18 +20,14 @@ type Brick = tuple[Voxel, Voxel]
 
 
 def part1(raw: str):
-    bricks = resting_state(parse(raw))
-    supporting = support_structure(bricks)
-    resting_on = invert_graph(supporting)
+    bricks, supporting, resting_on = settle(raw)
     extra_supported = {brick for brick in bricks if len(resting_on[brick]) > 1}
     safe = {brick for brick in bricks if supporting[brick] <= extra_supported}
     return len(safe)
 
 
 def part2(raw: str):
-    bricks = resting_state(parse(raw))
-    supporting = support_structure(bricks)
-    resting_on = invert_graph(supporting)
+    bricks, supporting, resting_on = settle(raw)
     total = 0
     for initial_brick in bricks:
         queue = deque([initial_brick])
@@ -45,6 +42,17 @@ def part2(raw: str):
     return total
 
 
+@memo.per_input
+def settle(
+    raw: str,
+) -> tuple[set[Brick], dict[Brick, set[Brick]], dict[Brick, set[Brick]]]:
+    """The bricks at rest, which bricks each supports, and which each rests on."""
+    bricks = resting_state(parse(raw))
+    supporting = support_structure(bricks)
+    resting_on = {brick: set() for brick in bricks} | invert_graph(supporting)
+    return bricks, supporting, resting_on
+
+
 def parse(raw: str) -> Iterable[Brick]:
     for line in raw.strip().splitlines():
         lhs, rhs = line.split("~")
@@ -119,35 +127,24 @@ def invert_graph[N](graph: dict[N, set[N]]) -> dict[N, set[N]]:
     return inverted
 
 
-def visualize(bricks: set[Brick]) -> str:
-    all_voxels = set.union(*map(voxels, bricks))
-    xs, ys, zs = zip(*all_voxels)
-    xrange = range(min(xs), max(xs) + 1)
-    zrange = range(min(zs), max(zs) + 1)
-    yrange = range(min(ys), max(ys) + 1)
-    return f"""
-    {'x':^{len(xrange)}}
-    {
-        '\n    '.join(
-                ''.join(
-                    '.#'[any((x, y, z) in all_voxels for y in yrange)]
-                    for x in xrange
-                )
-            for z in reversed(zrange)
-        )
-    }
-
-    {'y':^{len(yrange)}}
-    {
-        '\n    '.join(
-                ''.join(
-                    '.#'[any((x, y, z) in all_voxels for x in xrange)]
-                    for y in yrange
-                )
-            for z in reversed(zrange)
-        )
-    }
+def visualize(bricks: set[Brick]) -> render.Image:
+    """
+    The bricks seen along the y axis and along the x axis, side by side with a
+    grey line between, and z upwards.
     """
+    all_voxels = np.array(sorted(set.union(*map(voxels, bricks))))
+    x, y, z = (all_voxels - all_voxels.min(axis=0)).T
+    filled = np.zeros((x.max() + 1, y.max() + 1, z.max() + 1), dtype=bool)
+    filled[x, y, z] = True
+    # rows of z, from the top down
+    front = filled.any(axis=1).T[::-1]
+    side = filled.any(axis=0).T[::-1]
+    seen = np.hstack([front, np.zeros((front.shape[0], 1), dtype=bool), side])
+    divider = np.zeros(seen.shape, dtype=bool)
+    divider[:, front.shape[1]] = True
+    image = np.full((*seen.shape, 3), render.WHITE, dtype=np.uint8)
+    render.overlay(image, seen, render.BLACK)
+    return render.overlay(image, divider, render.GREY)
 
 
 if __name__ == "__main__":
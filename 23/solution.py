@@ -1,20 +1,21 @@
 import sys
 import re
+import pathlib
 from pprint import pprint
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, lazy
+from aoc.graph import Graph, Node
+from aoc.grid import Grid, Mask, neighbour_count
+
+np = lazy.module("numpy")
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
-type Vector = complex
-type Tile = Vector
-type Graph[N, W] = dict[N, dict[N, list[W]]]
+type Tile = int  # flat cell index, see Grid.flat
 
 
 def part1(raw: str):
@@ -30,92 +31,101 @@ def part2(raw: str):
 
 
 DIRECTIONS = {
-    ".": (+1, -1, +1j, -1j),
-    "v": (+1,),
-    "^": (-1,),
-    ">": (+1j,),
-    "<": (-1j,),
+    ".": ((+1, 0), (-1, 0), (0, +1), (0, -1)),
+    "v": ((+1, 0),),
+    "^": ((-1, 0),),
+    ">": ((0, +1),),
+    "<": ((0, -1),),
     "#": (),
 }
 
 
-def parse(raw: str) -> tuple[Tile, Tile, Graph[Tile, int]]:
-    lines = raw.strip().splitlines()
-    height = len(lines)
-    grid = {}
-    start, end = None, None
-    for row, line in enumerate(raw.strip().splitlines()):
-        for col, char in enumerate(line):
-            tile = row + col * 1j
-            grid[tile] = char
-            if char == "." and row == 0:
-                start = tile
-            if char == "." and row == height - 1:
-                end = tile
-    assert start is not None
-    assert end is not None
-    return start, end, to_graph(grid)
-
-
-def to_graph(grid: dict[Tile, str]) -> Graph[Tile, int]:
-    navigable = extract(grid, ".^v<>")
-    junctions_and_ends = {
-        tile for tile in navigable if len(neighbors(tile) & navigable) != 2
-    }
-    connected_tiles = {
-        tile: {tile + direction for direction in DIRECTIONS[grid[tile]]} & navigable
-        for tile in navigable
-    }
-    unexplored = junctions_and_ends.copy()
-    graph: Graph[Tile, int] = {}
-    while unexplored:
-        node = unexplored.pop()
-        for tile in connected_tiles[node]:
-            previous_tile, current_tile = node, tile
+def parse(raw: str) -> tuple[Node, Node, Graph]:
+    grid = Grid.parse(raw)
+    (start,) = (grid.flat(0, col) for col in range(grid.width) if grid[0, col] == ".")
+    (end,) = (
+        grid.flat(grid.height - 1, col)
+        for col in range(grid.width)
+        if grid[grid.height - 1, col] == "."
+    )
+    junctions, graph = to_graph(grid)
+    return junctions.index(start), junctions.index(end), graph
+
+
+def to_graph(grid: Grid) -> tuple[list[Tile], Graph]:
+    """
+    The junctions and dead ends, numbered in order of their tiles, and the
+    longest walk along each corridor between two of them.
+    """
+    navigable_mask = grid.mask(".^v<>")
+    junctions_and_ends = grid.flat_indices(
+        navigable_mask & (neighbour_count(navigable_mask) != 2)
+    ).tolist()
+    tiles = tile_graph(grid, navigable_mask)
+    offsets, targets = tiles.offsets.tolist(), tiles.targets.tolist()
+    node = {tile: index for index, tile in enumerate(junctions_and_ends)}
+    longest: dict[tuple[Node, Node], int] = {}
+    for junction in junctions_and_ends:
+        for tile in targets[offsets[junction] : offsets[junction + 1]]:
+            previous_tile, current_tile = junction, tile
             distance = 1
-            while current_tile not in junctions_and_ends:
-                successors = connected_tiles[current_tile] - {previous_tile}
+            while current_tile not in node:
+                successors = [
+                    successor
+                    for successor in targets[
+                        offsets[current_tile] : offsets[current_tile + 1]
+                    ]
+                    if successor != previous_tile
+                ]
                 if not successors:
                     break
                 (successor,) = successors
                 previous_tile, current_tile = current_tile, successor
                 distance += 1
             else:
-                edges = graph.setdefault(node, {})
-                weights = edges.setdefault(current_tile, [])
-                weights.append(distance)
-    return graph
-
-
-def longest_path(
-    start: Tile,
-    end: Tile,
-    graph: Graph[Tile, int],
-    visited: set[Tile] | None = None,
+                edge = node[junction], node[current_tile]
+                longest[edge] = max(longest.get(edge, 0), distance)
+    sources, ends = zip(*longest) if longest else ((), ())
+    graph = Graph.from_edges(len(node), sources, ends, list(longest.values()))
+    return junctions_and_ends, graph
+
+
+def tile_graph(grid: Grid, navigable: Mask) -> Graph:
+    """Steps between tiles, by flat index, only downhill on slopes."""
+    rows, cols = np.indices(grid.shape)
+    sources, targets = [], []
+    for char, directions in DIRECTIONS.items():
+        on = grid.mask(char) & navigable
+        for dr, dc in directions:
+            r, c = rows[on] + dr, cols[on] + dc
+            inside = grid.in_bounds(r, c)
+            inside[inside] = navigable[r[inside], c[inside]]
+            sources.append(grid.flat(rows[on][inside], cols[on][inside]))
+            targets.append(grid.flat(r[inside], c[inside]))
+    return Graph.from_edges(
+        grid.height * grid.width, np.concatenate(sources), np.concatenate(targets)
+    )
+
+
+def longest_path(start: Node, end: Node, graph: Graph) -> int:
+    return longest_walk(start, end, graph.adjacency(), visited=0)
+
+
+def longest_walk(
+    node: Node, end: Node, adjacency: list[list[tuple[Node, int]]], visited: int
 ) -> int:
-    if start == end:
+    """The longest walk from `node` to `end` not entering a node set in `visited`."""
+    if node == end:
         return 0
-    if visited is None:
-        visited = set()
     result = -1
-    visited.add(start)
-    for successor in graph[start]:
-        if successor not in visited:
-            path_cost = longest_path(successor, end, graph, visited)
-            edge_cost = max(graph[start][successor])
+    visited |= 1 << node
+    for successor, edge_cost in adjacency[node]:
+        if not visited >> successor & 1:
+            path_cost = longest_walk(successor, end, adjacency, visited)
             if path_cost != -1:
                 result = max(result, path_cost + edge_cost)
-    visited.remove(start)
     return result
 
 
-def extract(grid: dict[Tile, str], symbols: str) -> set[Tile]:
-    return {tile for tile, char in grid.items() if char in symbols}
-
-
-def neighbors(tile: Tile) -> set[Tile]:
-    return {tile + direction for direction in DIRECTIONS["."]}
-
-
 if __name__ == "__main__":
     raise SystemExit(main())
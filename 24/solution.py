@@ -1,15 +1,15 @@
 import sys
-import z3
+import pathlib
 from itertools import combinations
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, lazy, memo
+
+z3 = lazy.module("z3")
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Vec2D = tuple[float, float]
@@ -53,6 +53,7 @@ def in_test_area(v: Vec2D) -> bool:
     return (TA_MIN <= x <= TA_MAX) and (TA_MIN <= y <= TA_MAX)
 
 
+@memo.per_input
 def parse(raw: str):
     for line in raw.strip().splitlines():
         lhs, rhs = line.split("@")
@@ -73,7 +74,7 @@ def solve_2D(p1: Vec2D, v1: Vec2D, p2: Vec2D, v2: Vec2D) -> Vec2D | None:
 
 
 def invert_2D(matrix: Mat2D) -> Mat2D | None:
-    ((a, b), (c, d)) = matrix
+    (a, b), (c, d) = matrix
     det = a * d - b * c
     if det != 0:
         return ((d / det, -b / det), (-c / det, a / det))
@@ -1,15 +1,16 @@
+from __future__ import annotations
 import sys
-import networkx as nx
+import pathlib
 from itertools import combinations
 
+sys.path.append(str(pathlib.Path(__file__).resolve().parent.parent))
+from aoc import cli, lazy
+
+nx = lazy.module("networkx")
+
 
 def main():
-    raw = sys.stdin.read()
-    if "1" in sys.argv:
-        print(f"Part 1: {part1(raw)}")
-    if "2" in sys.argv:
-        print(f"Part 2: {part2(raw)}")
-    return 0
+    return cli.main(part1, part2)
 
 
 type Node = str
@@ -0,0 +1 @@
+"""Shared tooling for running, measuring and supporting the daily solutions."""
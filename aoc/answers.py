@@ -0,0 +1,78 @@
+"""
+An on-disk cache of answers, keyed by (hash of the solution's source, hash of
+the input, part), so unchanged code on an unchanged input isn't solved twice.
+
+The source hash covers the `aoc` package as well as `NN/solution.py`, since a
+change to shared code can change a day's answers too. Each entry is one small
+file; when the entries take up more than `max_bytes` of disk the least
+recently used go first.
+"""
+
+import os
+import hashlib
+import pathlib
+import functools
+
+from aoc import days
+
+CACHE = days.ROOT / ".cache" / "answers"
+MAX_BYTES = 16 << 20  # 16 MiB
+
+
+@functools.cache
+def source_hash(solution: pathlib.Path) -> str:
+    digest = hashlib.sha256()
+    for path in [solution, *sorted((days.ROOT / "aoc").glob("*.py"))]:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    def __init__(self, directory: pathlib.Path = CACHE, *, max_bytes: int = MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def path(self, solution: pathlib.Path, raw: str, part: int) -> pathlib.Path:
+        source = source_hash(solution.resolve())[:24]
+        return self.directory / f"{source}-{days.input_hash(raw)[:24]}-part{part}"
+
+    def get(self, solution: pathlib.Path, raw: str, part: int) -> str | None:
+        path = self.path(solution, raw, part)
+        try:
+            answer = path.read_text()
+            # the modification time records when the entry was last used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return answer
+
+    def put(self, solution: pathlib.Path, raw: str, part: int, answer: str):
+        path = self.path(solution, raw, part)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # a name of its own, since batch workers may write the same entry at once
+        partial = path.with_name(f"{path.name}.{os.getpid()}.partial")
+        partial.write_text(answer)
+        partial.replace(path)
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for path in self.directory.iterdir():
+            if path.suffix == ".partial":
+                continue
+            try:
+                entries.append((path.stat(), path))
+            except FileNotFoundError:  # evicted by another process meanwhile
+                continue
+        total = sum(disk_usage(stat) for stat, _ in entries)
+        entries.sort(key=lambda entry: entry[0].st_mtime)
+        for stat, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= disk_usage(stat)
+
+
+def disk_usage(stat: os.stat_result) -> int:
+    # a whole block per entry, however short the answer, where that's known
+    return getattr(stat, "st_blocks", 0) * 512 or stat.st_size
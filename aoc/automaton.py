@@ -0,0 +1,59 @@
+"""
+Finding the first of several patterns in a text in one pass, with an
+Aho-Corasick automaton: a trie of the patterns whose every state also knows
+where to go on any character, so each character of the text costs a single
+lookup, however many patterns there are and however they overlap.
+
+    digits = Automaton(["one", "two", "eight", "1", "2", "8"])
+    digits.first_match("xeightwo")              # 2, for "eight"
+    backwards = Automaton(p[::-1] for p in digits.patterns)
+    backwards.first_match(reversed("xeightwo"))  # 1, for "two"
+
+Where matches overlap, the first to end wins, and of those the longest.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+
+
+class Automaton:
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = list(patterns)
+        trie: list[dict[str, int]] = [{}]
+        # the pattern, by index, matched on reaching each state
+        self.output: list[int | None] = [None]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                if char not in trie[state]:
+                    trie[state][char] = len(trie)
+                    trie.append({})
+                    self.output.append(None)
+                state = trie[state][char]
+            if self.output[state] is None:
+                self.output[state] = index
+        # complete each state's moves with those of its longest proper suffix
+        # that's also in the trie, breadth first so that suffix is done already
+        self.moves: list[dict[str, int]] = [{} for _ in trie]
+        self.moves[0] = dict(trie[0])
+        fallback = [0] * len(trie)
+        queue = deque(trie[0].values())
+        while queue:
+            state = queue.popleft()
+            suffix = fallback[state]
+            if self.output[state] is None:
+                self.output[state] = self.output[suffix]
+            self.moves[state] = {**self.moves[suffix], **trie[state]}
+            for char, child in trie[state].items():
+                fallback[child] = self.moves[suffix].get(char, 0)
+                queue.append(child)
+
+    def first_match(self, text: Iterable[str]) -> int | None:
+        """The index of the pattern that ends first in `text`, if any does."""
+        moves, output = self.moves, self.output
+        state = 0
+        for char in text:
+            state = moves[state].get(char, 0)
+            if output[state] is not None:
+                return output[state]
+        return None
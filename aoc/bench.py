@@ -0,0 +1,203 @@
+"""Timing and memory measurement of a single solution part."""
+
+from __future__ import annotations
+import io
+import gc
+import json
+import math
+import time
+import statistics
+import functools
+import contextlib
+from dataclasses import dataclass, field, asdict
+from collections.abc import Callable
+
+from aoc import days, memo, memory
+
+type Solver = Callable[[str], object]
+
+
+TIMINGS = days.ROOT / ".cache" / "timings.json"
+
+
+@dataclass
+class Measurement:
+    day: int
+    part: int
+    answer: str
+    wall: list[float]
+    cpu: list[float]
+    peak: int
+    sites: list[memory.Site] = field(default_factory=list)
+
+    @property
+    def best_wall(self) -> float:
+        return min(self.wall)
+
+    @property
+    def best_cpu(self) -> float:
+        return min(self.cpu)
+
+    def to_json(self) -> dict:
+        return asdict(self) | dict(best_wall=self.best_wall, best_cpu=self.best_cpu)
+
+
+def measure(
+    day: int,
+    part: int,
+    solver: Solver,
+    raw: str,
+    *,
+    warmup: int = 0,
+    repeat: int = 1,
+    memory_top: int = 0,
+    memory_budget: int | None = None,
+) -> Measurement:
+    """
+    Run `solver` on `raw` `warmup` untimed times, but at least once so that
+    whatever it imports on first use isn't counted, then once under
+    tracemalloc to find its peak allocation (see memory.trace for `memory_top`
+    and `memory_budget`), then `repeat` timed times.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    for _ in range(max(warmup, 1)):
+        call(solver, raw)
+    _, report = memory.trace(
+        functools.partial(call, solver), raw, top=memory_top, budget=memory_budget
+    )
+    walls, cpus = [], []
+    for _ in range(repeat):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        answer = call(solver, raw)
+        walls.append(time.perf_counter() - wall_start)
+        cpus.append(time.process_time() - cpu_start)
+    return Measurement(
+        day=day,
+        part=part,
+        answer=str(answer),
+        wall=walls,
+        cpu=cpus,
+        peak=report.peak,
+        sites=report.sites,
+    )
+
+
+def sample(
+    solver: Solver, raw: str, *, warmup: int = 0, repeat: int = 1
+) -> tuple[object, list[float]]:
+    """
+    The answer and wall times of `repeat` runs of `solver`, after `warmup`
+    untimed ones. The garbage collector is paused during each timed run, and
+    collects between them instead.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    for _ in range(warmup):
+        call(solver, raw)
+    samples = []
+    enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            answer = call(solver, raw)
+            samples.append(time.perf_counter() - start)
+            if enabled:
+                gc.enable()
+    finally:
+        if enabled:
+            gc.enable()
+    return answer, samples
+
+
+def summarise(samples: list[float]) -> dict[str, float]:
+    return dict(
+        min=min(samples),
+        median=statistics.median(samples),
+        p95=percentile(samples, 95),
+    )
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """The nearest-rank percentile: no interpolation between samples."""
+    ordered = sorted(samples)
+    rank = math.ceil(percent / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def measure_part(day: int, part: int, **kwargs) -> Measurement:
+    raw = days.read_input(day)
+    if raw is None:
+        raise FileNotFoundError(days.input_path(day))
+    solver = getattr(days.load(day), f"part{part}")
+    return measure(day, part, solver, raw, **kwargs)
+
+
+def call(solver: Solver, raw: str) -> object:
+    # time every run from scratch, not from what an earlier run parsed
+    memo.clear()
+    # some solutions print visualisations as they go
+    with contextlib.redirect_stdout(io.StringIO()):
+        return solver(raw)
+
+
+def format_row(m: Measurement) -> str:
+    return (
+        f"day {m.day:02} part {m.part}  {m.answer:>20}  "
+        f"wall {format_seconds(m.best_wall):>9}  cpu {format_seconds(m.best_cpu):>9}  "
+        f"peak {format_bytes(m.peak):>9}"
+    )
+
+
+def format_sites(m: Measurement) -> str:
+    return "\n".join(
+        f"    {format_bytes(site.size):>9} in {site.count:>7} blocks  "
+        f"{site.filename}:{site.line}"
+        for site in m.sites
+    )
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    scaled = float(size)
+    for unit in ("KiB", "MiB", "GiB"):
+        scaled /= 1024
+        if scaled < 1024:
+            break
+    return f"{scaled:.1f} {unit}"
+
+
+def load_timings() -> dict[tuple[int, int], float]:
+    """Best wall time of each (day, part) from the most recent run that included it."""
+    if not TIMINGS.exists():
+        return {}
+    with open(TIMINGS) as file:
+        return {
+            (int(day), int(part)): seconds
+            for day, parts in json.load(file).items()
+            for part, seconds in parts.items()
+        }
+
+
+def save_timings(measurements: list[Measurement]):
+    timings = load_timings()
+    for m in measurements:
+        timings[m.day, m.part] = m.best_wall
+    document: dict[str, dict[str, float]] = {}
+    for (day, part), seconds in sorted(timings.items()):
+        document.setdefault(str(day), {})[str(part)] = seconds
+    TIMINGS.parent.mkdir(parents=True, exist_ok=True)
+    with open(TIMINGS, "w") as file:
+        json.dump(document, file, indent=2)
+        file.write("\n")
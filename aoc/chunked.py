@@ -0,0 +1,63 @@
+"""
+Solving a huge input on every core, for days whose answer is a sum over lines:
+the input file is memory-mapped, cut into chunks at line boundaries, and each
+chunk solved by the same part in a worker process. The partial answers are
+added up at the end.
+
+    python 01/solution.py 1 2 --jobs 0 < huge   # one worker per core
+
+Workers are forked after the file is mapped, so they share the mapping and
+each copies out only the chunks it's given, rather than being sent them.
+"""
+
+import os
+import mmap
+import multiprocessing
+from typing import BinaryIO
+from itertools import pairwise, repeat
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+type Solver = Callable[[str], object]
+type Span = tuple[int, int]
+
+# more chunks than workers, so that one slow chunk doesn't hold up the rest
+CHUNKS_PER_JOB = 4
+
+# the mapped input, inherited by the forked workers
+buffer: mmap.mmap | None = None
+
+
+def solve(solver: Solver, file: BinaryIO, *, jobs: int = 0) -> int:
+    """The sum of `solver` over chunks of the lines of `file`, in `jobs` processes."""
+    global buffer
+    jobs = jobs or os.cpu_count() or 1
+    if os.fstat(file.fileno()).st_size == 0:
+        return 0  # an empty file can't be mapped
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        spans = boundaries(buffer, jobs * CHUNKS_PER_JOB)
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(jobs, mp_context=context) as pool:
+            starts, stops = zip(*spans)
+            return sum(pool.map(solve_span, repeat(solver), starts, stops))
+
+
+def boundaries(data: bytes | mmap.mmap, count: int) -> list[Span]:
+    """About `count` spans of whole lines covering `data`, none of them empty."""
+    size = len(data)
+    cuts = [0]
+    for index in range(1, count):
+        newline = data.find(b"\n", max(size * index // count, cuts[-1]))
+        if newline == -1:
+            break
+        if newline + 1 > cuts[-1]:
+            cuts.append(newline + 1)
+    if cuts[-1] < size:
+        cuts.append(size)
+    return list(pairwise(cuts))
+
+
+def solve_span(solver: Solver, start: int, stop: int):
+    """Runs in a worker: `solver` on the lines from byte `start` to `stop`."""
+    assert buffer is not None, "workers must be forked after the input is mapped"
+    return solver(buffer[start:stop].decode())
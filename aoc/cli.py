@@ -0,0 +1,198 @@
+"""
+The command line shared by every `NN/solution.py`:
+
+    python NN/solution.py 1 2 < input
+    python NN/solution.py 2 --profile --top 30 < input
+    python NN/solution.py 1 2 --stream < input   # days that support it
+    python NN/solution.py 1 2 --cache < input    # reuse answers from before
+    python NN/solution.py 1 --repeat 50 --warmup 5 --samples times.json < input
+    python NN/solution.py 1 2 --jobs 8 < input   # days that support it
+
+With `--cache`, answers are looked up and stored by solution source and
+input (see aoc.answers), except when profiling, streaming or solving in
+chunks. It's off by default because a cached answer skips everything else a
+part does, such as printing a visualisation.
+"""
+
+import os
+import sys
+import stat
+import json
+import inspect
+import pathlib
+import argparse
+from typing import TextIO
+from collections.abc import Callable
+
+from aoc import days, answers
+
+type Solver = Callable[[str], object]
+type StreamSolver = Callable[[TextIO], object]
+
+
+PROFILES = days.ROOT / ".cache" / "profiles"
+
+
+def main(
+    part1: Solver,
+    part2: Solver,
+    argv: list[str] | None = None,
+    *,
+    streaming: tuple[StreamSolver, StreamSolver] | None = None,
+    summable: bool = False,
+) -> int:
+    """
+    `streaming` holds variants of the parts that read their input from a file
+    a piece at a time (see aoc.stream) instead of taking it as one string.
+    `summable` says each part's answer is the sum of its answers on any split
+    of the input's lines, so it can be solved in chunks (see aoc.chunked).
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.jobs is not None:
+        if not summable:
+            print("this day can't be solved in chunks", file=sys.stderr)
+            return 2
+        if not stat.S_ISREG(os.fstat(sys.stdin.fileno()).st_mode):
+            print("--jobs needs input redirected from a file", file=sys.stderr)
+            return 2
+        # only import the process pool machinery when it's used
+        from aoc import chunked
+
+        for part, solver in zip(days.PARTS, (part1, part2)):
+            if part in args.parts:
+                answer = chunked.solve(solver, sys.stdin.buffer, jobs=args.jobs)
+                print(f"Part {part}: {answer}")
+        return 0
+    if args.stream:
+        if streaming is None:
+            print("this day has no streaming mode", file=sys.stderr)
+            return 2
+        if len(set(args.parts)) > 1 and not sys.stdin.seekable():
+            print("streaming both parts needs seekable input", file=sys.stderr)
+            return 2
+        solvers = dict(zip(days.PARTS, streaming))
+    else:
+        solvers = dict(zip(days.PARTS, (part1, part2)))
+        raw = sys.stdin.read()
+    timings = {}
+    for part, solver in solvers.items():
+        if part not in args.parts:
+            continue
+        if args.stream:
+            if sys.stdin.seekable():
+                sys.stdin.seek(0)
+            puzzle_input = sys.stdin
+        else:
+            puzzle_input = raw
+        if args.profile:
+            # cProfile and pstats are slow to import, so only pay for them here
+            from aoc import profiling
+
+            stem = args.profile_dir / f"{day_of(solver)}-part{part}"
+            answer, report = profiling.profile(
+                solver, puzzle_input, stem=stem, top=args.top
+            )
+            print(f"Part {part}: {answer}")
+            print(f"profile written to {stem}.pstats and {stem}.collapsed")
+            print(report)
+        elif args.repeat:
+            # as with profiling, only import the benchmarking code when it's used
+            from aoc import bench
+
+            answer, samples = bench.sample(
+                solver, raw, warmup=args.warmup, repeat=args.repeat
+            )
+            stats = bench.summarise(samples)
+            print(f"Part {part}: {answer}")
+            print(
+                "  ".join(
+                    f"{name} {bench.format_seconds(t)}" for name, t in stats.items()
+                )
+                + f"  ({args.repeat} runs after {args.warmup} warmup)"
+            )
+            timings[str(part)] = dict(answer=str(answer), samples=samples) | stats
+        elif args.cache and not args.stream:
+            print(f"Part {part}: {cached_answer(solver, part, raw)}")
+        else:
+            print(f"Part {part}: {solver(puzzle_input)}")
+    if args.samples is not None:
+        document = dict(
+            day=day_of(part1), warmup=args.warmup, repeat=args.repeat, parts=timings
+        )
+        with open(args.samples, "w") as file:
+            json.dump(document, file, indent=2)
+            file.write("\n")
+    return 0
+
+
+def cached_answer(solver: Solver, part: int, raw: str) -> str:
+    cache = answers.AnswerCache()
+    solution = pathlib.Path(inspect.getfile(solver))
+    answer = cache.get(solution, raw, part)
+    if answer is None:
+        answer = str(solver(raw))
+        cache.put(solution, raw, part, answer)
+    return answer
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(usage="%(prog)s [1] [2] [options] < input")
+    parser.add_argument("parts", nargs="*", type=int, choices=days.PARTS)
+    parser.add_argument(
+        "--profile", action="store_true", help="run each part under cProfile"
+    )
+    parser.add_argument(
+        "--top", type=int, default=20, metavar="N", help="functions to report"
+    )
+    parser.add_argument(
+        "--profile-dir", type=pathlib.Path, default=PROFILES, metavar="DIR"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="read stdin in chunks rather than all at once",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="solve chunks of the input's lines in N processes (0 = one per core)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse an answer cached from an earlier run, and cache new ones",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=0,
+        metavar="N",
+        help="time N runs of each part, with garbage collection paused",
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=0, metavar="N", help="untimed runs first"
+    )
+    parser.add_argument(
+        "--samples", metavar="PATH", help="write the --repeat timings as JSON"
+    )
+    args = parser.parse_args(argv)
+    if args.repeat < 0 or args.warmup < 0:
+        parser.error("--repeat and --warmup must not be negative")
+    if not args.repeat and (args.warmup or args.samples):
+        parser.error("--warmup and --samples need --repeat")
+    if args.repeat and (args.profile or args.stream):
+        parser.error("--repeat can't be combined with --profile or --stream")
+    if args.jobs is not None:
+        if args.jobs < 0:
+            parser.error("--jobs must not be negative")
+        if args.profile or args.stream or args.repeat:
+            parser.error(
+                "--jobs can't be combined with --profile, --stream or --repeat"
+            )
+    return args
+
+
+def day_of(solver: Solver | StreamSolver) -> str:
+    folder = pathlib.Path(inspect.getfile(solver)).resolve().parent
+    return f"day{folder.name}"
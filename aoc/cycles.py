@@ -0,0 +1,104 @@
+"""
+Finding where a sequence of states, `start`, `step(start)`, `step(step(start))`
+and so on, begins to repeat, comparing states by their `key`: a fingerprint
+such as a digest of a grid's bytes.
+
+    cycle = cycles.find(rocks, spin, key=fingerprint)
+    cycle.start, cycle.length                       # mu and lambda
+    cycles.state_at(rocks, spin, 1_000_000_000, key=fingerprint)
+
+By default the search is Brent's algorithm, holding two states at a time
+however long the run-up to the cycle, but stepping from `start` again once it
+knows the cycle's length, so `step` must be a pure function of the state.
+With `remember=True` it keeps every key instead, no states, and takes each
+step once, which pays off when steps are dear and keys are small.
+"""
+
+from dataclasses import dataclass
+from collections.abc import Callable, Hashable
+
+
+@dataclass(frozen=True)
+class Cycle[S]:
+    start: int  # mu: the index of the first state that comes round again
+    length: int  # lambda
+    entry: S  # the state at index `start`
+
+    def reduce(self, index: int) -> int:
+        """The earliest index holding the same state as `index`."""
+        if index < self.start:
+            return index
+        return self.start + (index - self.start) % self.length
+
+
+def find[S](
+    start: S,
+    step: Callable[[S], S],
+    *,
+    key: Callable[[S], Hashable] | None = None,
+    remember: bool = False,
+) -> Cycle[S]:
+    if key is None:
+        key = identity
+    if remember:
+        return find_remembering(start, step, key)
+    # find the length: the hare runs ahead of a tortoise that teleports to it
+    # whenever the distance between them reaches the next power of two
+    power = length = 1
+    tortoise_key = key(start)
+    hare = step(start)
+    while key(hare) != tortoise_key:
+        if power == length:
+            tortoise_key = key(hare)
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+    # find the start: with the hare `length` ahead, they first meet on it
+    tortoise = hare = start
+    for _ in range(length):
+        hare = step(hare)
+    mu = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        mu += 1
+    return Cycle(mu, length, tortoise)
+
+
+def find_remembering[S](
+    start: S, step: Callable[[S], S], key: Callable[[S], Hashable]
+) -> Cycle[S]:
+    first_seen: dict[Hashable, int] = {}
+    state, index = start, 0
+    while (fingerprint := key(state)) not in first_seen:
+        first_seen[fingerprint] = index
+        state, index = step(state), index + 1
+    mu = first_seen[fingerprint]
+    # the state it stopped on is the one that came round again
+    return Cycle(mu, index - mu, state)
+
+
+def state_at[S](
+    start: S,
+    step: Callable[[S], S],
+    index: int,
+    *,
+    key: Callable[[S], Hashable] | None = None,
+    remember: bool = False,
+) -> S:
+    """The state `index` steps after `start`, without taking them all."""
+    cycle = find(start, step, key=key, remember=remember)
+    index = cycle.reduce(index)
+    if index < cycle.start:
+        return iterate(start, step, index)
+    return iterate(cycle.entry, step, index - cycle.start)
+
+
+def iterate[S](state: S, step: Callable[[S], S], times: int) -> S:
+    for _ in range(times):
+        state = step(state)
+    return state
+
+
+def identity[S](state: S) -> S:
+    return state
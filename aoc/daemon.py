@@ -0,0 +1,80 @@
+"""
+Talking to the solver daemon (serve.py), which keeps every solution imported,
+numpy, z3 and networkx included, in a pool of worker processes, and answers
+requests over a Unix domain socket. Only the client side and the workers'
+functions are here, so that clients don't import the server's machinery.
+
+Each connection carries one request and one response, both a JSON object
+preceded by its length as a 4-byte big-endian integer:
+
+    {"day": 12, "parts": [1, 2], "input": "..."}
+    {"answers": {"1": "...", "2": "..."}}   or   {"error": "..."}
+"""
+
+import io
+import json
+import socket
+import struct
+import traceback
+import contextlib
+
+from aoc import days, lazy, answers
+
+SOCKET = days.ROOT / ".cache" / "daemon.sock"
+
+LENGTH = struct.Struct(">I")
+
+
+def send(connection: socket.socket, message: dict):
+    data = json.dumps(message).encode()
+    connection.sendall(LENGTH.pack(len(data)) + data)
+
+
+def receive(connection: socket.socket) -> dict:
+    (length,) = LENGTH.unpack(receive_exactly(connection, LENGTH.size))
+    return json.loads(receive_exactly(connection, length))
+
+
+def receive_exactly(connection: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = connection.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("connection closed mid-message")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def ask(day: int, parts: list[int], raw: str, *, path=SOCKET) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(path))
+        send(connection, dict(day=day, parts=parts, input=raw))
+        return receive(connection)
+
+
+def preload():
+    """Runs as each worker starts: import everything it could need."""
+    for day in days.DAYS:
+        days.load(day)
+    lazy.load_all()
+
+
+def solve(day: int, parts: list[int], raw: str) -> dict:
+    """Runs in a worker: the same answers `python NN/solution.py` would give."""
+    try:
+        module = days.load(day)
+        solution = days.folder(day) / "solution.py"
+        cache = answers.AnswerCache()
+        solved = {}
+        for part in parts:
+            answer = cache.get(solution, raw, part)
+            if answer is None:
+                # some solutions print visualisations as they go
+                with contextlib.redirect_stdout(io.StringIO()):
+                    answer = str(getattr(module, f"part{part}")(raw))
+                cache.put(solution, raw, part, answer)
+            solved[str(part)] = answer
+        return dict(answers=solved)
+    except Exception:
+        return dict(error=traceback.format_exc())
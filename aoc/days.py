@@ -0,0 +1,74 @@
+"""Locating, importing and reading inputs for the daily `NN/solution.py` modules."""
+
+import sys
+import hashlib
+import pathlib
+import importlib.util
+from types import ModuleType
+
+from aoc import memo
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+DAYS = range(1, 26)
+PARTS = (1, 2)
+
+
+def folder(day: int) -> pathlib.Path:
+    return ROOT / f"{day:02}"
+
+
+def module_name(day: int) -> str:
+    return f"day{day:02}"
+
+
+def load(day: int) -> ModuleType:
+    name = module_name(day)
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, folder(day) / "solution.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses look their module up in sys.modules while the class body runs
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def reload(day: int) -> ModuleType:
+    """
+    Run a solution's (edited) source again in its existing module. This is what
+    importlib.reload does, except that reload can't find modules loaded from a
+    file location rather than through sys.path. The old version's memoised
+    results are dropped, since its functions are replaced by new ones.
+    """
+    if module_name(day) not in sys.modules:
+        # never loaded, or failed to: the first load runs the source anyway
+        return load(day)
+    module = load(day)
+    assert module.__spec__ is not None and module.__spec__.loader is not None
+    memo.discard(module.__name__)
+    module.__spec__.loader.exec_module(module)
+    return module
+
+
+def input_path(day: int) -> pathlib.Path:
+    return folder(day) / "input"
+
+
+def read_input(day: int) -> str | None:
+    path = input_path(day)
+    if not path.exists():
+        return None
+    return path.read_text()
+
+
+def example_paths(day: int) -> list[pathlib.Path]:
+    return sorted(folder(day).glob("example*"))
+
+
+def input_hash(raw: str) -> str:
+    return hashlib.sha256(raw.encode()).hexdigest()
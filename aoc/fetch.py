@@ -0,0 +1,57 @@
+"""Fetching puzzle inputs over one pooled HTTP session, with an on-disk cache."""
+
+import hashlib
+import pathlib
+import requests
+
+from aoc import days
+
+BASE_URL = "https://adventofcode.com"
+CACHE = days.ROOT / ".cache" / "inputs"
+
+
+class InputFetcher:
+    """
+    Inputs differ between accounts, so cached inputs are keyed by
+    (year, day, hash of the session token) and never by the token itself.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        base_url: str = BASE_URL,
+        cache: pathlib.Path = CACHE,
+    ):
+        self.session = requests.Session()
+        self.session.cookies.set("session", token)
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
+
+    def url(self, year: int, day: int) -> str:
+        return f"{self.base_url}/{year}/day/{day}/input"
+
+    def cache_path(self, year: int, day: int) -> pathlib.Path:
+        return self.cache / str(year) / f"{day:02}-{self.token_hash}"
+
+    def get(self, year: int, day: int, *, refresh: bool = False) -> str:
+        path = self.cache_path(year, day)
+        if not refresh and path.exists():
+            return path.read_text()
+        response = self.session.get(self.url(year, day))
+        response.raise_for_status()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".partial")
+        partial.write_text(response.text)
+        partial.replace(path)
+        return response.text
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
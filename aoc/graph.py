@@ -0,0 +1,197 @@
+"""
+Searching graphs whose nodes are the integers 0 .. n - 1, with the edges held
+in compressed sparse row (CSR) form: the edges leaving node `u` are
+`targets[offsets[u]:offsets[u + 1]]`, weighing `weights[...]` the same slice,
+or 1 each in an unweighted graph. Nothing is allocated per node; a grid cell
+is its flat index (see Grid.flat), and other states are numbered however
+suits the day. Indices are int32 unless a graph is too big for them.
+
+    garden = graph.from_mask(grid.mask(".S"))
+    for depth, layer in enumerate(graph.bfs_layers(garden, [start])): ...
+    cost, path = graph.shortest_path(states, sources, goals, heuristic=h)
+
+Layers of a breadth-first search are expanded a whole frontier at a time with
+NumPy. Weighted searches go node by node, so they run over plain lists, and
+keep their frontier in a bucket queue, one list per distance, since weights
+are small non-negative integers.
+"""
+
+from __future__ import annotations
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from aoc import grid, lazy
+from aoc.grid import ORTHOGONAL, Mask
+
+np = lazy.module("numpy")
+
+type Node = int
+
+UNREACHED = -1
+
+
+@dataclass(frozen=True)
+class Graph:
+    offsets: np.ndarray  # size + 1
+    targets: np.ndarray  # one per edge
+    weights: np.ndarray | None = None  # int64, one per edge; None if all 1
+
+    @classmethod
+    def from_edges(cls, size: int, sources, targets, weights=None) -> Graph:
+        """An edge from each of `sources` to the same position of `targets`."""
+        dtype = index_dtype(max(size, len(sources)))
+        sources = np.asarray(sources, dtype=dtype)
+        targets = np.asarray(targets, dtype=dtype)
+        order = np.argsort(sources, kind="stable")
+        offsets = np.zeros(size + 1, dtype=dtype)
+        np.cumsum(np.bincount(sources, minlength=size), out=offsets[1:])
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.int64)[order]
+        return cls(offsets, targets[order], weights)
+
+    @property
+    def size(self) -> int:
+        return len(self.offsets) - 1
+
+    def neighbours(self, node: Node) -> np.ndarray:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def degrees(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def edge_weights(self) -> list[int]:
+        if self.weights is None:
+            return [1] * len(self.targets)
+        return self.weights.tolist()
+
+    def adjacency(self) -> list[list[tuple[Node, int]]]:
+        """Each node's (target, weight) edges as lists, for node-by-node searches."""
+        targets, weights = self.targets.tolist(), self.edge_weights()
+        bounds = self.offsets.tolist()
+        return [
+            list(zip(targets[start:end], weights[start:end]))
+            for start, end in zip(bounds, bounds[1:])
+        ]
+
+
+def from_mask(mask: Mask) -> Graph:
+    """Steps between adjacent set cells of `mask`, each node a flat index."""
+    height, width = mask.shape
+    size = height * width
+    dtype = index_dtype(size * len(ORTHOGONAL))
+    # whether each step is open from each cell, one direction at a time
+    open_steps = [(mask & grid.shift(mask, -dr, -dc)).ravel() for dr, dc in ORTHOGONAL]
+    offsets = np.zeros(size + 1, dtype=dtype)
+    np.cumsum(sum(open_steps, np.zeros(size, dtype=np.uint8)), out=offsets[1:])
+    # each cell's edges go in direction order, so fill its slots direction by
+    # direction, keeping where its next edge goes
+    targets = np.empty(offsets[-1], dtype=dtype)
+    next_slot = offsets[:-1].copy()
+    for (dr, dc), open_step in zip(ORTHOGONAL, open_steps):
+        sources = np.flatnonzero(open_step).astype(dtype)
+        targets[next_slot[sources]] = sources + (dr * width + dc)
+        next_slot[sources] += 1
+    return Graph(offsets, targets)
+
+
+def expand(graph: Graph, frontier: np.ndarray) -> np.ndarray:
+    """Targets of every edge leaving `frontier`, with repeats."""
+    starts = graph.offsets[frontier]
+    counts = graph.offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    # the index of each edge: its node's first edge, plus how far along it is
+    skips = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return graph.targets[skips + np.arange(total)]
+
+
+def bfs_layers(graph: Graph, sources: Iterable[Node]) -> Iterator[np.ndarray]:
+    """The nodes first reached after 0, 1, 2, ... steps, a layer at a time."""
+    seen = np.zeros(graph.size, dtype=bool)
+    # which of a layer's repeats of each node is kept: any one, as long as it's one
+    claimed = np.zeros(graph.size, dtype=graph.targets.dtype)
+    frontier = np.unique(np.fromiter(sources, dtype=graph.targets.dtype))
+    while len(frontier):
+        seen[frontier] = True
+        yield frontier
+        reached = expand(graph, frontier)
+        reached = reached[~seen[reached]]
+        order = np.arange(len(reached), dtype=claimed.dtype)
+        claimed[reached] = order
+        frontier = reached[claimed[reached] == order]
+
+
+def distances(graph: Graph, sources: Iterable[Node], *, limit: int | None = None):
+    """Steps from the nearest source to each node; UNREACHED beyond `limit`."""
+    result = np.full(graph.size, UNREACHED, dtype=graph.targets.dtype)
+    for depth, layer in enumerate(bfs_layers(graph, sources)):
+        if limit is not None and depth > limit:
+            break
+        result[layer] = depth
+    return result
+
+
+def shortest_path(
+    graph: Graph,
+    sources: Iterable[Node],
+    goals: Iterable[Node],
+    *,
+    heuristic: np.ndarray | None = None,
+) -> tuple[int, list[Node]] | None:
+    """
+    The cheapest path from any of `sources` to any of `goals`, by Dijkstra's
+    algorithm, or A* given a consistent `heuristic`: a lower bound on the cost
+    from each node to the nearest goal.
+    """
+    offsets, targets, weights = (
+        graph.offsets.tolist(),
+        graph.targets.tolist(),
+        graph.edge_weights(),
+    )
+    estimate = [0] * graph.size if heuristic is None else heuristic.tolist()
+    is_goal = bytearray(graph.size)
+    for goal in goals:
+        is_goal[goal] = True
+    cost = [None] * graph.size
+    previous = [UNREACHED] * graph.size
+    buckets: list[list[Node]] = []
+    for source in sources:
+        cost[source] = 0
+        push(buckets, estimate[source], source)
+    done = bytearray(graph.size)
+    for bucket in buckets:
+        # a consistent heuristic never lowers the priority of what's pushed, so
+        # new entries land in this bucket or one appended after it
+        while bucket:
+            node = bucket.pop()
+            if done[node]:
+                continue
+            done[node] = True
+            if is_goal[node]:
+                return cost[node], path_to(node, previous)
+            reached = cost[node]
+            for edge in range(offsets[node], offsets[node + 1]):
+                target = targets[edge]
+                new_cost = reached + weights[edge]
+                if cost[target] is None or new_cost < cost[target]:
+                    cost[target] = new_cost
+                    previous[target] = node
+                    push(buckets, new_cost + estimate[target], target)
+    return None
+
+
+def index_dtype(count: int):
+    """int32 if it can index `count` things, as it nearly always can; else int64."""
+    return np.int32 if count < 2**31 else np.int64
+
+
+def push(buckets: list[list[Node]], priority: int, node: Node):
+    while len(buckets) <= priority:
+        buckets.append([])
+    buckets[priority].append(node)
+
+
+def path_to(node: Node, previous: list[Node]) -> list[Node]:
+    path = [node]
+    while previous[path[-1]] != UNREACHED:
+        path.append(previous[path[-1]])
+    return path[::-1]
@@ -0,0 +1,124 @@
+"""
+A rectangular character grid held as a 2-D `uint8` NumPy array: one byte per
+cell instead of a dict entry keyed by `complex` or `(row, col)`.
+
+Cells can still be addressed one at a time with `(row, col)` tuples, but the
+intended use is whole-grid boolean masks: `grid.mask(".S")` selects every
+navigable cell, `neighbours(mask)` steps a whole frontier at once.
+"""
+
+from __future__ import annotations
+
+from aoc import lazy
+
+np = lazy.module("numpy")
+
+type Cell = tuple[int, int]
+type Mask = np.ndarray  # bool, same shape as the grid
+
+
+ORTHOGONAL: tuple[Cell, ...] = ((-1, 0), (+1, 0), (0, -1), (0, +1))
+
+
+class Grid:
+    def __init__(self, cells: np.ndarray):
+        if cells.ndim != 2 or cells.dtype != np.uint8:
+            raise ValueError("expected a 2-D uint8 array")
+        self.cells = cells
+
+    @classmethod
+    def parse(cls, raw: str) -> Grid:
+        lines = raw.strip().splitlines()
+        if len({len(line) for line in lines}) != 1:
+            raise ValueError("grid rows differ in length")
+        buffer = np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8)
+        return cls(buffer.reshape(len(lines), len(lines[0])).copy())
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    def __getitem__(self, cell: Cell) -> str:
+        return chr(self.cells[cell])
+
+    def __setitem__(self, cell: Cell, char: str):
+        self.cells[cell] = ord(char)
+
+    def __contains__(self, cell: Cell) -> bool:
+        row, col = cell
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def in_bounds(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        return (0 <= rows) & (rows < self.height) & (0 <= cols) & (cols < self.width)
+
+    def mask(self, chars: str) -> Mask:
+        """Cells holding any of `chars`."""
+        return np.isin(self.cells, np.frombuffer(chars.encode("ascii"), np.uint8))
+
+    def extract(self, chars: str) -> list[Cell]:
+        """Positions of the cells holding any of `chars`, in row-major order."""
+        return [(row, col) for row, col in np.argwhere(self.mask(chars)).tolist()]
+
+    def flat(self, rows, cols):
+        return rows * self.width + cols
+
+    def unflat(self, indices):
+        return np.divmod(indices, self.width)
+
+    def flat_indices(self, mask: Mask) -> np.ndarray:
+        return np.flatnonzero(mask)
+
+    def tile(self, m: int, n: int) -> Grid:
+        return Grid(np.tile(self.cells, (m, n)))
+
+    def copy(self) -> Grid:
+        return Grid(self.cells.copy())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return np.array_equal(self.cells, other.cells)
+
+    def __hash__(self) -> int:
+        return hash((self.shape, self.cells.tobytes()))
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode("ascii") for row in self.cells)
+
+
+def shift(mask: Mask, dr: int, dc: int) -> Mask:
+    """Move every set cell of `mask` by (dr, dc), dropping cells that leave the grid."""
+    height, width = mask.shape
+    shifted = np.zeros_like(mask)
+    shifted[
+        max(dr, 0) : height + min(dr, 0),
+        max(dc, 0) : width + min(dc, 0),
+    ] = mask[
+        max(-dr, 0) : height + min(-dr, 0),
+        max(-dc, 0) : width + min(-dc, 0),
+    ]
+    return shifted
+
+
+def neighbours(mask: Mask) -> Mask:
+    """Cells orthogonally adjacent to any set cell of `mask`."""
+    result = np.zeros_like(mask)
+    for dr, dc in ORTHOGONAL:
+        result |= shift(mask, dr, dc)
+    return result
+
+
+def neighbour_count(mask: Mask) -> np.ndarray:
+    """Number of set cells of `mask` orthogonally adjacent to each cell."""
+    count = np.zeros(mask.shape, dtype=np.uint8)
+    for dr, dc in ORTHOGONAL:
+        count += shift(mask, dr, dc)
+    return count
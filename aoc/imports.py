@@ -0,0 +1,59 @@
+"""
+Import-time measurement of the solution modules, each in a fresh interpreter
+with `-X importtime` so that nothing is already cached in sys.modules.
+"""
+
+import re
+import sys
+import subprocess
+from dataclasses import dataclass, field
+
+from aoc import days, bench
+
+MARKER = "-- loading solution --"
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+SCRIPT = f"""
+import sys, time
+from aoc import days, bench
+print({MARKER!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+days.load({{day}})
+print(time.perf_counter() - start)
+"""
+
+
+@dataclass
+class ImportTime:
+    day: int
+    seconds: float
+    # the slowest modules imported directly by the solution, cumulative seconds
+    heaviest: list[tuple[str, float]] = field(default_factory=list)
+
+
+def import_time(day: int, *, top: int = 3) -> ImportTime:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT.format(day=day)],
+        cwd=days.ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    _, _, log = process.stderr.partition(MARKER)
+    direct = []
+    for line in log.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        # the least-indented entries are the ones the solution asked for
+        if match and len(match[3]) == 1:
+            direct.append((match[4], int(match[2]) / 1e6))
+    direct.sort(key=lambda entry: entry[1], reverse=True)
+    return ImportTime(
+        day=day, seconds=float(process.stdout.strip()), heaviest=direct[:top]
+    )
+
+
+def format_row(timing: ImportTime) -> str:
+    heaviest = ", ".join(
+        f"{name} {bench.format_seconds(seconds)}" for name, seconds in timing.heaviest
+    )
+    return f"day {timing.day:02} import  {bench.format_seconds(timing.seconds):>9}  ({heaviest})"
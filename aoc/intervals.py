@@ -0,0 +1,126 @@
+"""
+Sets of integers held as runs, and sets of points held as boxes, both as
+arrays of bounds rather than one Python object per run, so that splitting,
+intersecting and measuring happen for every run or box in one go.
+
+    seeds = IntervalSet([79, 55], [93, 68])     # [79, 93) and [55, 68)
+    seeds.split([60, 90]).volume()             # 27, now in four runs
+    below, above = Boxes.cube(4, 1, 4001).split(axis=0, at=1351)
+
+Every bound is half-open, like `range`: a run is start <= x < stop, and a box
+is lows <= point < highs along each axis.
+"""
+
+from __future__ import annotations
+
+from aoc import lazy
+
+np = lazy.module("numpy")
+
+
+class IntervalSet:
+    """
+    Runs of integers, `starts[i] <= x < stops[i]`, in order of start. Splitting
+    and intersecting expect runs that don't overlap, as after `coalesce`.
+    """
+
+    def __init__(self, starts, stops):
+        starts = np.asarray(starts, dtype=np.int64)
+        stops = np.asarray(stops, dtype=np.int64)
+        keep = starts < stops
+        order = np.argsort(starts[keep], kind="stable")
+        self.starts = starts[keep][order]
+        self.stops = stops[keep][order]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        runs = ", ".join(f"[{a}, {b})" for a, b in zip(self.starts, self.stops))
+        return f"IntervalSet({runs})"
+
+    def volume(self) -> int:
+        return int((self.stops - self.starts).sum())
+
+    def min(self) -> int:
+        return int(self.starts[0])
+
+    def coalesce(self) -> IntervalSet:
+        """Merge runs that overlap or touch, leaving the fewest runs possible."""
+        if not len(self):
+            return self
+        reach = np.maximum.accumulate(self.stops)
+        # a run starts a new group if it begins beyond everything before it
+        first = np.flatnonzero(np.r_[True, self.starts[1:] > reach[:-1]])
+        last = np.r_[first[1:], len(self)] - 1
+        return IntervalSet(self.starts[first], reach[last])
+
+    def split(self, points) -> IntervalSet:
+        """The same integers, with a run cut in two at each point inside it."""
+        points = np.unique(np.asarray(points, dtype=np.int64))
+        container = np.searchsorted(self.stops, points, side="right")
+        inside = container < len(self)
+        inside[inside] = self.starts[container[inside]] < points[inside]
+        cuts = points[inside]
+        return IntervalSet(
+            np.sort(np.concatenate([self.starts, cuts])),
+            np.sort(np.concatenate([self.stops, cuts])),
+        )
+
+    def intersect(self, other: IntervalSet) -> IntervalSet:
+        """Integers in both, a run for each overlapping pair of runs."""
+        # the runs of `other` that can overlap each run of `self`
+        first = np.searchsorted(other.stops, self.starts, side="right")
+        last = np.searchsorted(other.starts, self.stops, side="left")
+        counts = np.maximum(last - first, 0)
+        mine = np.repeat(np.arange(len(self)), counts)
+        # each pair's place in `other`: the first candidate, plus how far along
+        skips = np.repeat(first - np.cumsum(counts) + counts, counts)
+        theirs = skips + np.arange(len(mine))
+        return IntervalSet(
+            np.maximum(self.starts[mine], other.starts[theirs]),
+            np.minimum(self.stops[mine], other.stops[theirs]),
+        )
+
+    def shift(self, offsets) -> IntervalSet:
+        """Move each run by its own offset, or all of them by one."""
+        return IntervalSet(self.starts + offsets, self.stops + offsets)
+
+
+class Boxes:
+    """Axis-aligned boxes of integer points, `lows[i] <= point < highs[i]`."""
+
+    def __init__(self, lows, highs):
+        self.lows = np.asarray(lows, dtype=np.int64)
+        self.highs = np.asarray(highs, dtype=np.int64)
+
+    @classmethod
+    def cube(cls, dimensions: int, low: int, high: int) -> Boxes:
+        return cls(np.full((1, dimensions), low), np.full((1, dimensions), high))
+
+    @classmethod
+    def concatenate(cls, boxes: list[Boxes]) -> Boxes:
+        return cls(
+            np.concatenate([b.lows for b in boxes]),
+            np.concatenate([b.highs for b in boxes]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.lows)
+
+    def volume(self) -> int:
+        """Points in all the boxes, counting overlaps more than once."""
+        return int(np.prod(self.highs - self.lows, axis=1).sum())
+
+    def split(self, axis: int, at: int) -> tuple[Boxes, Boxes]:
+        """Every box cut in two: the points below `at` along `axis`, and the rest."""
+        below_highs = self.highs.copy()
+        below_highs[:, axis] = np.minimum(self.highs[:, axis], at)
+        above_lows = self.lows.copy()
+        above_lows[:, axis] = np.maximum(self.lows[:, axis], at)
+        below = self.lows[:, axis] < below_highs[:, axis]
+        above = above_lows[:, axis] < self.highs[:, axis]
+        return (
+            Boxes(self.lows[below], below_highs[below]),
+            Boxes(above_lows[above], self.highs[above]),
+        )
@@ -0,0 +1,37 @@
+"""
+Deferred imports for heavy third-party modules.
+
+    np = lazy.module("numpy")
+
+binds `np` straight away but only executes numpy on the first attribute
+access, so importing a solution that needs numpy for one part costs nothing
+until that part runs. Long-running processes can pay for every deferred
+import up front instead, with `load_all()`.
+"""
+
+import sys
+import importlib.util
+from types import ModuleType
+
+deferred: list[ModuleType] = []
+
+
+def module(name: str) -> ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    lazy_module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = lazy_module
+    loader.exec_module(lazy_module)
+    deferred.append(lazy_module)
+    return lazy_module
+
+
+def load_all():
+    for lazy_module in deferred:
+        # any attribute access runs the real import
+        lazy_module.__name__
@@ -0,0 +1,46 @@
+"""
+Sharing parsed input, and state derived from it, between `part1` and `part2`.
+
+    @memo.per_input
+    def parse(raw: str) -> ...:
+
+Both parts then get the very same objects for the same input, so they must
+treat them as read-only. Generator functions are run to completion and their
+results kept as a tuple.
+"""
+
+import inspect
+import functools
+from collections.abc import Callable
+
+# a few entries, since some days also parse variations of the input
+CACHE_SIZE = 4
+
+caches: list = []
+
+
+def per_input[**P, R](func: Callable[P, R]) -> Callable[P, R]:
+    if inspect.isgeneratorfunction(func):
+        generator = func
+
+        @functools.wraps(generator)
+        def func(*args, **kwargs):
+            return tuple(generator(*args, **kwargs))
+
+    cached = functools.lru_cache(maxsize=CACHE_SIZE)(func)
+    caches.append(cached)
+    return cached  # type: ignore
+
+
+def clear():
+    """Forget every memoised result, e.g. so each benchmark run starts cold."""
+    for cached in caches:
+        cached.cache_clear()
+
+
+def discard(module: str):
+    """Empty and stop tracking the caches of `module`'s functions, to reload it."""
+    for cached in caches:
+        if cached.__module__ == module:
+            cached.cache_clear()
+    caches[:] = [cached for cached in caches if cached.__module__ != module]
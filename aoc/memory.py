@@ -0,0 +1,107 @@
+"""
+Tracing the memory a solution part allocates: its peak, where the peak was
+allocated, and an optional hard budget.
+"""
+
+from __future__ import annotations
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from collections.abc import Callable
+
+MiB = 1 << 20
+
+
+class MemoryBudgetExceeded(Exception):
+    pass
+
+
+@dataclass
+class Site:
+    filename: str
+    line: int
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryReport:
+    peak: int
+    sites: list[Site] = field(default_factory=list)
+
+
+def trace(
+    solver: Callable[[str], object],
+    raw: str,
+    *,
+    top: int = 0,
+    budget: int | None = None,
+) -> tuple[object, MemoryReport]:
+    """
+    Call `solver(raw)` under tracemalloc. With `top`, also report the `top`
+    allocation sites by size as of the largest snapshot taken: tracemalloc can
+    only snapshot live memory, so a snapshot is taken whenever a function
+    returns with traced memory at least 10% above the last one. With `budget`
+    (bytes), raise MemoryBudgetExceeded as soon as a function returns with more
+    than that allocated.
+    """
+    if not top and budget is None:
+        tracemalloc.start()
+        try:
+            answer = solver(raw)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return answer, MemoryReport(peak=peak)
+
+    snapshot = None
+    snapshot_size = 0
+
+    def watch(frame, event, arg):
+        nonlocal snapshot, snapshot_size
+        if event not in ("return", "c_return"):
+            return
+        current, _ = tracemalloc.get_traced_memory()
+        if budget is not None and current > budget:
+            raise MemoryBudgetExceeded(
+                f"{current / MiB:.2f} MiB allocated, budget is {budget / MiB:.2f} MiB"
+            )
+        if top and current > snapshot_size * 1.1:
+            sys.setprofile(None)  # snapshots call back into Python
+            snapshot = tracemalloc.take_snapshot()
+            snapshot_size = current
+            sys.setprofile(watch)
+
+    tracemalloc.start()
+    sys.setprofile(watch)
+    try:
+        answer = solver(raw)
+    finally:
+        sys.setprofile(None)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    if budget is not None and peak > budget:
+        raise MemoryBudgetExceeded(
+            f"peak of {peak / MiB:.2f} MiB, budget is {budget / MiB:.2f} MiB"
+        )
+    return answer, MemoryReport(peak=peak, sites=top_sites(snapshot, top))
+
+
+def top_sites(snapshot: tracemalloc.Snapshot | None, top: int) -> list[Site]:
+    if snapshot is None:
+        return []
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    return [
+        Site(
+            filename=stat.traceback[0].filename,
+            line=stat.traceback[0].lineno,
+            size=stat.size,
+            count=stat.count,
+        )
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
@@ -0,0 +1,59 @@
+"""
+Pulling the integers out of puzzle input, fast.
+
+    parsing.ints("Card 1: 41 48 | 83 86")           # [1, 41, 48, 83, 86]
+    parsing.ints(b"0 -3 6", negatives=True)          # [0, -3, 6]
+    parsing.int_array(raw, negatives=True)           # every integer in raw
+
+Rather than matching numbers with a regular expression, every byte that can't
+be part of one is translated to a space in a single pass in C, which leaves
+`bytes.split` (or NumPy's text parser, for arrays) to do the rest.
+"""
+
+from __future__ import annotations
+import re
+
+from aoc import lazy
+
+np = lazy.module("numpy")
+
+DIGITS = bytes(b if b in b"0123456789" else ord(" ") for b in range(256))
+SIGNED = bytes(b if b in b"-0123456789" else ord(" ") for b in range(256))
+# a minus sign only counts right before a digit, and starts a new number
+# even right after one, as in "3-4"
+LONE_MINUS = re.compile(rb"-(?!\d)")
+INNER_MINUS = re.compile(rb"(?<=\d)-")
+# int64 holds every number of up to 18 digits, but not every one of 19
+LONG_NUMBER = re.compile(rb"\d{19}")
+
+
+def ints(text: str | bytes, *, negatives: bool = False) -> list[int]:
+    return list(map(int, numbers(text, negatives).split()))
+
+
+def int_array(text: str | bytes, *, negatives: bool = False) -> np.ndarray:
+    """
+    Every integer in `text`, as one flat array of int64. NumPy's text parser
+    saturates numbers beyond int64 rather than failing, so given any of 19
+    digits or more this parses them exactly instead, and raises OverflowError
+    if one doesn't fit.
+    """
+    buffer = numbers(text, negatives)
+    if not buffer.strip():
+        return np.zeros(0, dtype=np.int64)
+    if LONG_NUMBER.search(buffer):
+        return np.array(list(map(int, buffer.split())), dtype=np.int64)
+    return np.fromstring(buffer, dtype=np.int64, sep=" ")
+
+
+def numbers(text: str | bytes, negatives: bool) -> bytes:
+    """`text` with every byte that isn't part of a number made a space."""
+    if isinstance(text, str):
+        text = text.encode()
+    if not negatives:
+        return text.translate(DIGITS)
+    buffer = text.translate(SIGNED)
+    if b"-" in buffer:
+        buffer = LONE_MINUS.sub(b" ", buffer)
+        buffer = INNER_MINUS.sub(b" -", buffer)
+    return buffer
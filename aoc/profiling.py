@@ -0,0 +1,97 @@
+"""Running a solution part under cProfile and summarising where the time went."""
+
+import io
+import pstats
+import pathlib
+import cProfile
+from collections.abc import Callable, Iterable
+
+type Function = tuple[str, int, str]  # pstats' (filename, line, name)
+
+# how far down the collapsed stacks go, and the least time they break out
+MAX_DEPTH = 32
+MIN_FRACTION = 1e-3
+
+
+def profile(
+    solver: Callable[[str], object],
+    raw: str,
+    *,
+    stem: pathlib.Path,
+    top: int = 20,
+) -> tuple[object, str]:
+    """
+    Call `solver(raw)` under cProfile and write `<stem>.pstats` and
+    `<stem>.collapsed` (one `frame;frame;frame microseconds` line per stack,
+    as read by flamegraph.pl and speedscope). Returns the answer and a report
+    of the `top` functions by cumulative time.
+    """
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(solver, raw)
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(stem.with_suffix(".pstats"))
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    with open(stem.with_suffix(".collapsed"), "w") as file:
+        for stack, microseconds in collapsed_stacks(stats.stats):  # type: ignore
+            if microseconds:
+                file.write(f"{';'.join(stack)} {microseconds}\n")
+    return answer, report.getvalue()
+
+
+def collapsed_stacks(stats: dict) -> Iterable[tuple[tuple[str, ...], int]]:
+    """
+    cProfile only records caller -> callee edges, not whole stacks, so the
+    stacks are rebuilt by walking down from the functions nobody called and
+    sharing each function's time between its callers in proportion to the
+    cumulative time spent in it on behalf of each. Recursion is cut off at
+    the first repeated frame.
+
+    There can be exponentially many paths through the call graph, so a walk
+    stops MAX_DEPTH frames down, or where less than MIN_FRACTION of the total
+    time is left to share out, and charges what's below to the frame it
+    stopped at. Identical stacks are merged.
+    """
+    callees: dict[Function, dict[Function, tuple]] = {func: {} for func in stats}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[func] = edge
+    roots = [func for func, (*_, callers) in stats.items() if not callers]
+    threshold = MIN_FRACTION * sum(stats[root][3] for root in roots)
+    totals: dict[tuple[str, ...], float] = {}
+
+    def walk(func: Function, stack: tuple[str, ...], on_stack: set, share: float):
+        _, _, self_time, cumulative, _ = stats[func]
+        if cumulative <= 0:
+            return
+        charged = self_time * share
+        for callee, (_, _, _, edge_cumulative) in callees[func].items():
+            if callee in on_stack:
+                continue
+            callee_cumulative = stats[callee][3]
+            if callee_cumulative <= 0:
+                continue
+            weight = share * edge_cumulative
+            if len(stack) >= MAX_DEPTH or weight < threshold:
+                charged += weight
+                continue
+            walk(
+                callee,
+                (*stack, frame_name(callee)),
+                on_stack | {callee},
+                weight / callee_cumulative,
+            )
+        totals[stack] = totals.get(stack, 0.0) + charged
+
+    for root in roots:
+        walk(root, (frame_name(root),), {root}, 1.0)
+    for stack, seconds in totals.items():
+        yield stack, round(seconds * 1e6)
+
+
+def frame_name(func: Function) -> str:
+    filename, line, name = func
+    if filename == "~":  # builtins
+        return name
+    return f"{name} ({pathlib.Path(filename).name}:{line})"
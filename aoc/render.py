@@ -0,0 +1,91 @@
+"""
+Rendering grids as images: an RGB `uint8` array of shape (height, width, 3),
+filled a whole grid or mask at a time, then written out in one go as a binary
+PPM (P6) or a PNG.
+
+    image = render.paint(grid, {".": WHITE, "#": BLACK})
+    render.overlay(image, reached, BLUE)
+    render.save("garden.png", render.enlarge(image, 4))
+"""
+
+from __future__ import annotations
+import zlib
+import struct
+import pathlib
+
+from aoc import lazy
+from aoc.grid import Grid, Mask
+
+np = lazy.module("numpy")
+
+type Colour = tuple[int, int, int]
+type Image = np.ndarray  # uint8, (height, width, 3)
+
+BLACK: Colour = (0, 0, 0)
+WHITE: Colour = (255, 255, 255)
+GREY: Colour = (128, 128, 128)
+RED: Colour = (255, 0, 0)
+GREEN: Colour = (0, 255, 0)
+BLUE: Colour = (0, 0, 255)
+
+
+def paint(grid: Grid, palette: dict[str, Colour], *, default: Colour = BLACK) -> Image:
+    """Colour every cell by its character, through a 256-entry lookup table."""
+    table = np.full((256, 3), default, dtype=np.uint8)
+    for char, colour in palette.items():
+        table[ord(char)] = colour
+    return table[grid.cells]
+
+
+def shade(values: np.ndarray, *, dark: Colour = BLACK, light: Colour = WHITE) -> Image:
+    """Colour numbers from `dark` for the smallest to `light` for the largest."""
+    low, high = values.min(), values.max()
+    fraction = (values - low) / max(high - low, 1)
+    start, end = np.array(dark), np.array(light)
+    return (start + fraction[..., np.newaxis] * (end - start)).astype(np.uint8)
+
+
+def overlay(image: Image, mask: Mask, colour: Colour) -> Image:
+    image[mask] = colour
+    return image
+
+
+def enlarge(image: Image, factor: int) -> Image:
+    """Draw every cell as a `factor` x `factor` square of pixels."""
+    return image.repeat(factor, axis=0).repeat(factor, axis=1)
+
+
+def ppm(image: Image) -> bytes:
+    height, width, _ = image.shape
+    return b"P6 %d %d 255\n" % (width, height) + image.astype(np.uint8).tobytes()
+
+
+def png(image: Image, *, level: int = 6) -> bytes:
+    height, width, _ = image.shape
+    # each row starts with its filter type, 0 for none
+    rows = np.zeros((height, 1 + 3 * width), dtype=np.uint8)
+    rows[:, 1:] = image.reshape(height, 3 * width)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + png_chunk(b"IHDR", header)
+        + png_chunk(b"IDAT", zlib.compress(rows.tobytes(), level))
+        + png_chunk(b"IEND", b"")
+    )
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    checksum = zlib.crc32(data, zlib.crc32(kind))
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", checksum)
+
+
+def save(path: str | pathlib.Path, image: Image):
+    """Write `image` as a PNG or PPM, whichever `path`'s suffix names."""
+    path = pathlib.Path(path)
+    match path.suffix.lower():
+        case ".png":
+            path.write_bytes(png(image))
+        case ".ppm":
+            path.write_bytes(ppm(image))
+        case suffix:
+            raise ValueError(f"can't write {suffix or 'unsuffixed'} images")
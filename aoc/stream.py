@@ -0,0 +1,32 @@
+"""
+Reading input a piece at a time, for days that only ever look at one line or
+token at once. Memory is bounded by the chunk size plus the longest piece.
+"""
+
+from typing import TextIO
+from collections.abc import Iterator
+
+CHUNK_SIZE = 1 << 16
+
+
+def split(file: TextIO, sep: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    pending: list[str] = []
+    while chunk := file.read(chunk_size):
+        first, *complete = chunk.split(sep)
+        pending.append(first)
+        if complete:
+            yield "".join(pending)
+            *complete, rest = complete
+            yield from complete
+            pending = [rest]
+    tail = "".join(pending)
+    if tail:
+        yield tail
+
+
+def lines(file: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Non-blank lines, without their line endings."""
+    for line in split(file, "\n", chunk_size):
+        line = line.rstrip("\r")
+        if line.strip():
+            yield line
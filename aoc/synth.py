@@ -0,0 +1,651 @@
+"""
+Seeded generators of synthetic puzzle inputs, for measuring how the solutions
+scale. Every generator takes a size and a `random.Random` and returns input
+text in the day's format, built so that the solution can run on it. What
+"size" means differs between days: see each generator's docstring.
+
+    raw = synth.generate(16, 200, seed=1)  # a 200x200 mirror grid
+"""
+
+import itertools
+import random
+import string
+from dataclasses import dataclass
+from collections.abc import Callable
+
+type Generator = Callable[[int, random.Random], str]
+type Cell = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class Synthesiser:
+    generate: Generator
+    sizes: tuple[int, ...]  # a default sweep, from quick to a few seconds
+
+
+SYNTHESISERS: dict[int, Synthesiser] = {}
+
+
+def synthesiser(day: int, sizes: tuple[int, ...]):
+    def register(generate: Generator) -> Generator:
+        SYNTHESISERS[day] = Synthesiser(generate, sizes)
+        return generate
+
+    return register
+
+
+def generate(day: int, size: int, *, seed: int = 0) -> str:
+    if day not in SYNTHESISERS:
+        raise KeyError(f"no generator for day {day:02}")
+    if size < 1:
+        raise ValueError("size must be positive")
+    return SYNTHESISERS[day].generate(size, random.Random(f"{day}:{size}:{seed}"))
+
+
+@synthesiser(1, sizes=(1_000, 4_000, 16_000, 64_000))
+def calibration_document(size: int, rng: random.Random) -> str:
+    """`size` lines, each with at least one numeric digit."""
+    names = "one two three four five six seven eight nine".split()
+    lines = []
+    for _ in range(size):
+        pieces = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(1, 8)):
+            match rng.randrange(3):
+                case 0:
+                    pieces.append(rng.choice(names))
+                case 1:
+                    pieces.append(rng.choice(string.digits[1:]))
+                case _:
+                    pieces.append(random_word(rng, 1, 5))
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+    return join_lines(lines)
+
+
+@synthesiser(2, sizes=(1_000, 4_000, 16_000, 64_000))
+def cube_games(size: int, rng: random.Random) -> str:
+    """`size` games of one to six draws."""
+    lines = []
+    for game_id in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colours))
+        lines.append(f"Game {game_id}: {'; '.join(draws)}")
+    return join_lines(lines)
+
+
+@synthesiser(3, sizes=(40, 80, 160, 320))
+def engine_schematic(size: int, rng: random.Random) -> str:
+    """A `size` x `size` schematic of numbers and symbols."""
+    rows = []
+    for _ in range(size):
+        row = []
+        while len(row) < size:
+            roll = rng.random()
+            if roll < 0.12:
+                row.extend(str(rng.randint(1, 999)))
+                row.append(".")
+            elif roll < 0.17:
+                row.append(rng.choice("*#+$/=%@&-"))
+            else:
+                row.append(".")
+        rows.append("".join(row[:size]))
+    return join_lines(rows)
+
+
+@synthesiser(4, sizes=(1_000, 4_000, 16_000, 64_000))
+def scratchcards(size: int, rng: random.Random) -> str:
+    """`size` cards of 10 winning numbers and 25 numbers held."""
+    lines = []
+    width = len(str(size))
+    for card_id in range(1, size + 1):
+        # mostly few matches, or the number of copies grows exponentially
+        matching = min(10, size - card_id, int(rng.expovariate(1.5)))
+        numbers = rng.sample(range(1, 100), 35 - matching)
+        winning = numbers[:10]
+        held = numbers[10:] + rng.sample(winning, matching)
+        rng.shuffle(held)
+        lines.append(
+            f"Card {card_id:>{width}}: {format_numbers(winning)} | {format_numbers(held)}"
+        )
+    return join_lines(lines)
+
+
+@synthesiser(5, sizes=(100, 400, 1_600, 6_400))
+def almanac(size: int, rng: random.Random) -> str:
+    """`size` seed ranges, and `size` ranges in each of the seven maps."""
+    limit = 1 << 32
+    seeds = []
+    for _ in range(size):
+        start = rng.randrange(limit // 2)
+        seeds += [start, rng.randint(1, limit // (4 * size))]
+    names = "seed soil fertilizer water light temperature humidity location".split()
+    paras = [f"seeds: {' '.join(map(str, seeds))}"]
+    for source, dest in zip(names, names[1:]):
+        cuts = sorted(rng.sample(range(1, limit), 2 * size))
+        lines = [f"{source}-to-{dest} map:"]
+        for start, stop in zip(cuts[::2], cuts[1::2]):
+            length = stop - start
+            lines.append(f"{rng.randrange(limit - length)} {start} {length}")
+        paras.append("\n".join(lines))
+    return "\n\n".join(paras) + "\n"
+
+
+@synthesiser(6, sizes=(4, 8, 16, 32))
+def boat_races(size: int, rng: random.Random) -> str:
+    """
+    `size` races. Part 2 joins the digits of every race, so beyond 50 or so
+    races its floating-point square root overflows.
+    """
+    times, distances = [], []
+    for _ in range(size):
+        time = rng.randint(100, 999)
+        times.append(str(time))
+        distances.append(str(rng.randint(1000, min(9999, time**2 // 4 - 1))))
+    width = max(map(len, times + distances)) + 1
+    return (
+        "Time:    " + "".join(f"{t:>{width}}" for t in times) + "\n"
+        "Distance:" + "".join(f"{d:>{width}}" for d in distances) + "\n"
+    )
+
+
+@synthesiser(7, sizes=(1_000, 4_000, 16_000, 64_000))
+def camel_cards(size: int, rng: random.Random) -> str:
+    """`size` distinct hands."""
+    hands = set()
+    while len(hands) < min(size, 13**5):
+        hands.add("".join(rng.choices("23456789TJQKA", k=5)))
+    return join_lines(f"{hand} {rng.randint(1, 1000)}" for hand in sorted(hands))
+
+
+@synthesiser(8, sizes=(25, 50, 100, 200))
+def haunted_network(size: int, rng: random.Random) -> str:
+    """
+    `size` instructions and six ghosts. As in the real inputs, each ghost's
+    path is one loop through a single ..Z node a whole number of passes
+    through the instructions long; here both branches of a node agree.
+    """
+    instructions = "".join(rng.choices("LR", k=size))
+    alphabet = string.digits[1:] + string.ascii_uppercase
+    tags = rng.sample([a + b for a in alphabet for b in alphabet if a != b], 5)
+    ghosts = [("AAA", "ZZZ")] + [(f"{tag}A", f"{tag}Z") for tag in tags]
+    names = iter(
+        rng.sample(
+            [
+                a + b + c
+                for a in alphabet
+                for b in alphabet
+                for c in alphabet
+                if c not in "AZ"
+            ],
+            k=56 * size,
+        )
+    )
+    network = {}
+    for (start, goal), passes in zip(ghosts, (3, 5, 7, 11, 13, 17)):
+        loop = [next(names) for _ in range(passes * size - 1)] + [goal]
+        network[start] = loop[0]
+        for node, successor in zip(loop, loop[1:] + loop[:1]):
+            network[node] = successor
+    lines = [f"{node} = ({succ}, {succ})" for node, succ in network.items()]
+    rng.shuffle(lines)
+    return f"{instructions}\n\n" + join_lines(lines)
+
+
+@synthesiser(9, sizes=(1_000, 4_000, 16_000, 64_000))
+def oasis_report(size: int, rng: random.Random) -> str:
+    """`size` sequences of 21 values of polynomials of degree at most five."""
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 6))]
+        values = [sum(c * x**i for i, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+    return join_lines(lines)
+
+
+@synthesiser(10, sizes=(30, 60, 120, 240))
+def pipe_maze(size: int, rng: random.Random) -> str:
+    """A `size` x `size` field of pipes holding one loop through S."""
+    blocks = max(2, (size - 1) // 3)
+    region = tree_region(blocks, blocks, rng, node=2, gap=1)
+    loop = boundary_loop(region)
+    pipes = {".": set(), "|": {"N", "S"}, "-": {"W", "E"}, "L": {"N", "E"}}
+    pipes |= {"J": {"N", "W"}, "7": {"S", "W"}, "F": {"S", "E"}}
+    grid = [[rng.choice("..|-LJ7F") for _ in range(size)] for _ in range(size)]
+    for pred, cell, succ in zip(*rotations(loop)):
+        ends = {heading(cell, pred), heading(cell, succ)}
+        r, c = cell
+        grid[r][c] = next(char for char, shape in pipes.items() if shape == ends)
+    r, c = rng.choice(loop)
+    grid[r][c] = "S"
+    # keep junk pipes from joining onto S and forming a second loop
+    for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        neighbour = (r + dr, c + dc)
+        if neighbour not in loop and 0 <= r + dr < size and 0 <= c + dc < size:
+            grid[r + dr][c + dc] = "."
+    return join_lines("".join(row) for row in grid)
+
+
+@synthesiser(11, sizes=(50, 100, 200, 400))
+def galaxy_image(size: int, rng: random.Random) -> str:
+    """A `size` x `size` image with about one galaxy per 50 cells."""
+    empty_rows = set(rng.sample(range(size), size // 10))
+    empty_cols = set(rng.sample(range(size), size // 10))
+    rows = [
+        "".join(
+            (
+                "#"
+                if r not in empty_rows and c not in empty_cols and rng.random() < 0.02
+                else "."
+            )
+            for c in range(size)
+        )
+        for r in range(size)
+    ]
+    rows[0] = "#" + rows[0][1:]
+    return join_lines(rows)
+
+
+@synthesiser(12, sizes=(250, 500, 1_000, 2_000))
+def spring_records(size: int, rng: random.Random) -> str:
+    """`size` records of five to twenty springs."""
+    lines = []
+    while len(lines) < size:
+        length = rng.randint(5, 20)
+        springs = []
+        blocks = []
+        while len(springs) < length:
+            if rng.random() < 0.5:
+                block = rng.randint(1, max(1, min(6, length - len(springs))))
+                springs += ["#"] * block + ["."]
+                blocks.append(block)
+            else:
+                springs.append(".")
+        springs = springs[:length]
+        if not blocks or springs.count("#") != sum(blocks):
+            continue
+        record = "".join("?" if rng.random() < 0.4 else s for s in springs)
+        lines.append(f"{record} {','.join(map(str, blocks))}")
+    return join_lines(lines)
+
+
+@synthesiser(13, sizes=(100, 400, 1_600, 6_400))
+def mirror_patterns(size: int, rng: random.Random) -> str:
+    """
+    `size` patterns. Each has one perfect horizontal line of reflection, and
+    one vertical line with exactly one smudge, kept clear of the first line.
+    """
+    patterns = []
+    for _ in range(size):
+        height, width = rng.randint(7, 17), rng.randint(5, 17)
+        row_line = rng.randint(1, (height - 1) // 2)
+        col_line = rng.randint(1, width - 1)
+
+        def canonical(r: int, c: int) -> Cell:
+            if r < 2 * row_line:
+                r = min(r, 2 * row_line - 1 - r)
+            if 2 * col_line - width <= c < 2 * col_line:
+                c = min(c, 2 * col_line - 1 - c)
+            return r, c
+
+        fundamental = {}
+        rows = [
+            [
+                fundamental.setdefault(canonical(r, c), rng.choice("#."))
+                for c in range(width)
+            ]
+            for r in range(height)
+        ]
+        r = rng.randrange(2 * row_line, height)
+        c = rng.randrange(max(0, 2 * col_line - width), min(width, 2 * col_line))
+        rows[r][c] = "#" if rows[r][c] == "." else "."
+        patterns.append("\n".join("".join(row) for row in rows))
+    return "\n\n".join(patterns) + "\n"
+
+
+@synthesiser(14, sizes=(25, 50, 100, 200))
+def rock_platform(size: int, rng: random.Random) -> str:
+    """A `size` x `size` platform of rounded and square rocks."""
+    return random_grid(size, size, rng, {"O": 0.2, "#": 0.15})
+
+
+@synthesiser(15, sizes=(1_000, 4_000, 16_000, 64_000))
+def initialization_sequence(size: int, rng: random.Random) -> str:
+    """`size` steps on about `size` / 4 lens labels."""
+    labels = [random_word(rng, 2, 6) for _ in range(max(1, size // 4))]
+    steps = [
+        f"{label}={rng.randint(1, 9)}" if rng.random() < 0.7 else f"{label}-"
+        for label in rng.choices(labels, k=size)
+    ]
+    return ",".join(steps) + "\n"
+
+
+@synthesiser(16, sizes=(25, 50, 100, 200))
+def mirror_contraption(size: int, rng: random.Random) -> str:
+    """A `size` x `size` contraption of mirrors and splitters."""
+    return random_grid(size, size, rng, {c: 0.025 for c in "/\\|-"})
+
+
+@synthesiser(17, sizes=(10, 20, 40, 80))
+def heat_loss_map(size: int, rng: random.Random) -> str:
+    """A `size` x `size` map of heat losses."""
+    return join_lines("".join(rng.choices("123456789", k=size)) for _ in range(size))
+
+
+@synthesiser(18, sizes=(4, 8, 16, 32))
+def dig_plan(size: int, rng: random.Random) -> str:
+    """
+    A dig plan around a random tree of about `size`**2 / 2 blocks. The hex
+    codes describe the same shape with its coordinates spread out.
+    """
+    region = tree_region(size, size, rng, node=2, gap=2)
+    corners = [
+        cell
+        for pred, cell, succ in zip(*rotations(boundary_loop(region)))
+        if heading(pred, cell) != heading(cell, succ)
+    ]
+    spread = {}
+    for axis in (0, 1):
+        values = sorted({corner[axis] for corner in corners})
+        gaps = [rng.randint(1, 5_000) for _ in values]
+        spread[axis] = dict(zip(values, itertools.accumulate(gaps)))
+    lines = []
+    for cell, succ in zip(corners, corners[1:] + corners[:1]):
+        direction = heading(cell, succ)
+        axis = 0 if direction in "NS" else 1
+        length = abs(succ[axis] - cell[axis])
+        hex_length = abs(spread[axis][succ[axis]] - spread[axis][cell[axis]])
+        letter, digit = {"E": ("R", 0), "S": ("D", 1), "W": ("L", 2), "N": ("U", 3)}[
+            direction
+        ]
+        lines.append(f"{letter} {length} (#{hex_length:05x}{digit})")
+    return join_lines(lines)
+
+
+@synthesiser(19, sizes=(100, 400, 1_600, 6_400))
+def workflows(size: int, rng: random.Random) -> str:
+    """A tree of `size` workflows, and `size` parts."""
+    names = iter(rng.sample(all_words(3), size))
+    pending = ["in"]
+    made = 1
+    lines = []
+    while pending:
+        name = pending.pop(rng.randrange(len(pending)))
+        rules = []
+        for rule in range(rng.randint(1, 3) + 1):
+            # always branch at least once, so the tree doesn't die out early
+            if made < size and (rule == 0 or rng.random() < 0.5):
+                destination = next(names)
+                pending.append(destination)
+                made += 1
+            else:
+                destination = rng.choice("AR")
+            rules.append(destination)
+        fallback = rules.pop()
+        conditions = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{dest}"
+            for dest in rules
+        ]
+        lines.append(f"{name}{{{','.join(conditions + [fallback])}}}")
+    parts = [
+        "{" + ",".join(f"{axis}={rng.randint(1, 4000)}" for axis in "xmas") + "}"
+        for _ in range(size)
+    ]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n\n" + join_lines(parts)
+
+
+@synthesiser(20, sizes=(4, 8, 16, 32))
+def pulse_modules(size: int, rng: random.Random) -> str:
+    """
+    `size` twelve-bit counters, wired like the real inputs: a chain of
+    flip-flops per counter, read by a conjunction that resets the counter,
+    and every counter's inverter feeding one conjunction in front of rx.
+    """
+    names = iter(rng.sample([w for w in all_words(2, 3) if w != "rx"], 16 * size + 1))
+    hub = next(names)
+    lines = []
+    starts = []
+    for _ in range(size):
+        bits = [next(names) for _ in range(12)]
+        counter, inverter = next(names), next(names)
+        number = rng.randrange(1 << 11, 1 << 12) | 1
+        for place, bit in enumerate(bits):
+            destinations = bits[place + 1 : place + 2]
+            if number >> place & 1:
+                destinations.append(counter)
+            lines.append(f"%{bit} -> {', '.join(destinations)}")
+        resets = [bit for place, bit in enumerate(bits) if not number >> place & 1]
+        lines.append(f"&{counter} -> {', '.join([bits[0], *resets, inverter])}")
+        lines.append(f"&{inverter} -> {hub}")
+        starts.append(bits[0])
+    lines.append(f"&{hub} -> rx")
+    lines.append(f"broadcaster -> {', '.join(starts)}")
+    rng.shuffle(lines)
+    return join_lines(lines)
+
+
+@synthesiser(21, sizes=(21, 41, 81, 161))
+def garden(size: int, rng: random.Random) -> str:
+    """
+    A `size` x `size` garden (rounded up to an odd size), with the clear
+    middle row and column and clear edges the part 2 extrapolation relies on.
+    """
+    size |= 1
+    middle = size // 2
+    rows = []
+    for r in range(size):
+        row = []
+        for c in range(size):
+            clear = r in (0, middle, size - 1) or c in (0, middle, size - 1)
+            row.append("." if clear or rng.random() > 0.12 else "#")
+        rows.append(row)
+    rows[middle][middle] = "S"
+    return join_lines("".join(row) for row in rows)
+
+
+@synthesiser(22, sizes=(250, 500, 1_000, 2_000))
+def sand_bricks(size: int, rng: random.Random) -> str:
+    """`size` non-overlapping bricks over a 10 x 10 footprint."""
+    occupied = set()
+    lines = []
+    z_range = max(10, size // 2)
+    while len(lines) < size:
+        axis = rng.randrange(3)
+        length = rng.randint(1, 4)
+        start = [rng.randrange(10), rng.randrange(10), rng.randint(1, z_range)]
+        end = list(start)
+        end[axis] += length - 1
+        if end[0] > 9 or end[1] > 9:
+            continue
+        voxels = {
+            tuple(start[i] + (i == axis) * offset for i in range(3))
+            for offset in range(length)
+        }
+        if voxels & occupied:
+            continue
+        occupied |= voxels
+        lines.append(f"{','.join(map(str, start))}~{','.join(map(str, end))}")
+    return join_lines(lines)
+
+
+@synthesiser(23, sizes=(2, 3, 4, 5))
+def hiking_trails(size: int, rng: random.Random) -> str:
+    """
+    A `size` x `size` lattice of junctions joined by corridors of random
+    lengths, with slopes leading right and down out of every junction.
+    """
+    rows = [1] + [0] * (size - 1)
+    cols = [rng.randint(1, 3)] + [0] * (size - 1)
+    for i in range(1, size):
+        rows[i] = rows[i - 1] + rng.randint(4, 12)
+        cols[i] = cols[i - 1] + rng.randint(4, 12)
+    height, width = rows[-1] + 2, cols[-1] + rng.randint(2, 4)
+    grid = [["#"] * width for _ in range(height)]
+    for i, r in enumerate(rows):
+        for j, c in enumerate(cols):
+            grid[r][c] = "."
+            if j + 1 < size:
+                for cc in range(c + 1, cols[j + 1]):
+                    grid[r][cc] = "."
+                grid[r][c + 1] = grid[r][cols[j + 1] - 1] = ">"
+            if i + 1 < size:
+                for rr in range(r + 1, rows[i + 1]):
+                    grid[rr][c] = "."
+                grid[r + 1][c] = grid[rows[i + 1] - 1][c] = "v"
+    grid[0][cols[0]] = "."
+    grid[height - 1][cols[-1]] = "."
+    return join_lines("".join(row) for row in grid)
+
+
+@synthesiser(24, sizes=(20, 40, 80, 160))
+def hailstones(size: int, rng: random.Random) -> str:
+    """`size` hailstones that one thrown rock hits, each at its own time."""
+    rock = [rng.randint(150, 350) * 10**12 for _ in range(3)]
+    rock_velocity = [rng.randint(-300, 300) for _ in range(3)]
+    times = rng.sample(range(10**11, 10**12), size)
+    lines = []
+    for time in times:
+        velocity = [rng.randint(-300, 300) for _ in range(3)]
+        position = [
+            p + time * (rv - v) for p, rv, v in zip(rock, rock_velocity, velocity)
+        ]
+        lines.append(
+            f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}"
+        )
+    return join_lines(lines)
+
+
+@synthesiser(25, sizes=(100, 200, 400, 800))
+def wiring_diagram(size: int, rng: random.Random) -> str:
+    """
+    Two halves of `size` / 2 components, each the union of three random
+    cycles, joined by exactly three wires.
+    """
+    names = rng.sample(all_words(3), 2 * (size // 2))
+    halves = names[: size // 2], names[size // 2 :]
+    wires = []
+    for half in halves:
+        for _ in range(3):
+            order = rng.sample(half, len(half))
+            wires += zip(order, order[1:] + order[:1])
+    wires += zip(rng.sample(halves[0], 3), rng.sample(halves[1], 3))
+    wiring: dict[str, list[str]] = {}
+    seen = set()
+    for u, v in wires:
+        if frozenset((u, v)) not in seen:
+            seen.add(frozenset((u, v)))
+            wiring.setdefault(u, []).append(v)
+    return join_lines(f"{u}: {' '.join(vs)}" for u, vs in wiring.items())
+
+
+def join_lines(lines) -> str:
+    return "\n".join(lines) + "\n"
+
+
+def random_word(rng: random.Random, shortest: int, longest: int) -> str:
+    return "".join(
+        rng.choices(string.ascii_lowercase, k=rng.randint(shortest, longest))
+    )
+
+
+def all_words(*lengths: int) -> list[str]:
+    return [
+        "".join(letters)
+        for length in lengths
+        for letters in itertools.product(string.ascii_lowercase, repeat=length)
+    ]
+
+
+def format_numbers(numbers: list[int]) -> str:
+    return " ".join(f"{number:>2}" for number in numbers)
+
+
+def random_grid(
+    height: int, width: int, rng: random.Random, densities: dict[str, float]
+) -> str:
+    chars, weights = zip(*densities.items())
+    chars += (".",)
+    weights += (1 - sum(weights),)
+    return join_lines(
+        "".join(rng.choices(chars, weights, k=width)) for _ in range(height)
+    )
+
+
+def tree_region(
+    height: int, width: int, rng: random.Random, *, node: int, gap: int
+) -> set[Cell]:
+    """
+    The cells of a random tree over a `height` x `width` lattice of blocks,
+    drawn with `node` x `node` squares for blocks and corridors of the same
+    width between them, `gap` cells apart. A thickened tree has no holes and
+    no cells touching only at a corner, so its boundary is one simple loop.
+    """
+    pitch = node + gap
+    start = (rng.randrange(height), rng.randrange(width))
+    visited = {start}
+    frontier = [
+        (start, neighbour) for neighbour in lattice_neighbours(start, height, width)
+    ]
+    cells = set()
+    target = max(2, height * width * 2 // 3)
+    while frontier and len(visited) < target:
+        parent, block = frontier.pop(rng.randrange(len(frontier)))
+        if block in visited:
+            continue
+        visited.add(block)
+        (r0, c0), (r1, c1) = sorted([parent, block])
+        cells |= square(
+            r0 * pitch, c0 * pitch, (r1 - r0) * pitch + node, (c1 - c0) * pitch + node
+        )
+        frontier += [(block, n) for n in lattice_neighbours(block, height, width)]
+    return {(r + 1, c + 1) for r, c in cells}  # leave room for the loop itself
+
+
+def lattice_neighbours(block: Cell, height: int, width: int) -> list[Cell]:
+    r, c = block
+    return [
+        (r + dr, c + dc)
+        for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+        if 0 <= r + dr < height and 0 <= c + dc < width
+    ]
+
+
+def square(row: int, col: int, height: int, width: int) -> set[Cell]:
+    return {(r, c) for r in range(row, row + height) for c in range(col, col + width)}
+
+
+def boundary_loop(region: set[Cell]) -> list[Cell]:
+    """
+    The lattice points around `region` in order, as cells of a grid whose
+    cell (r, c) stands for the corner at the top left of region cell (r, c).
+    """
+    successor = {}
+    for r, c in region:
+        if (r - 1, c) not in region:
+            successor[r, c + 1] = (r, c)
+        if (r + 1, c) not in region:
+            successor[r + 1, c] = (r + 1, c + 1)
+        if (r, c - 1) not in region:
+            successor[r, c] = (r + 1, c)
+        if (r, c + 1) not in region:
+            successor[r + 1, c + 1] = (r, c + 1)
+    start = min(successor)
+    loop = [start]
+    while (point := successor[loop[-1]]) != start:
+        loop.append(point)
+    assert len(loop) == len(successor), "region boundary is not one simple loop"
+    return loop
+
+
+def heading(cell: Cell, other: Cell) -> str:
+    """The direction from `cell` to `other`, in the same row or column."""
+    (r0, c0), (r1, c1) = cell, other
+    return {(-1, 0): "N", (1, 0): "S", (0, -1): "W", (0, 1): "E"}[
+        (r1 > r0) - (r1 < r0), (c1 > c0) - (c1 < c0)
+    ]
+
+
+def rotations[T](loop: list[T]) -> tuple[list[T], list[T], list[T]]:
+    return loop[-1:] + loop[:-1], loop, loop[1:] + loop[:1]
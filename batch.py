@@ -0,0 +1,174 @@
+"""
+Run one day's solution over many inputs, importing it once per worker process
+rather than once per input, and stream the results out as JSON lines.
+
+    python batch.py 12 inputs/12/                 # every file in a directory
+    python batch.py 12 'inputs/12/*.txt' -j 4     # a glob, four workers
+    python batch.py 12 inputs/12/ -o results.jsonl
+    python batch.py 12 inputs/12/ --no-cache      # solve even if answered before
+
+Each line holds the input's path and SHA-256, the part, and either its answer
+and wall time in seconds or the error it raised. Answers found in the answer
+cache (see aoc/answers.py) are marked "cached" and not timed.
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import pathlib
+import argparse
+import traceback
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc import days, bench, answers
+
+type Record = dict[str, object]
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+    paths = expand(args.inputs)
+    if not paths:
+        print("no inputs found", file=sys.stderr)
+        return 1
+    # import in the parent, both to fail early and so forked workers inherit it
+    days.load(args.day)
+    cache = None if args.no_cache else answers.AnswerCache()
+    if args.jobs == 1:
+        records = (
+            record
+            for path in paths
+            for record in solve(args.day, path, args.parts, cache=cache)
+        )
+    else:
+        records = solve_parallel(
+            args.day,
+            paths,
+            args.parts,
+            workers=args.jobs or os.cpu_count(),
+            cache=cache,
+        )
+    output = sys.stdout if args.output is None else open(args.output, "w")
+    failures = 0
+    try:
+        for record in records:
+            failures += "error" in record
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(f"{len(paths)} inputs, {failures} failed parts", file=sys.stderr)
+    return 1 if failures else 0
+
+
+def expand(patterns: list[str]) -> list[pathlib.Path]:
+    """Files named by `patterns`, which may be files, directories or globs."""
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = pathlib.Path(pattern).iterdir()
+        elif any(char in pattern for char in "*?["):
+            candidates = map(pathlib.Path, glob.glob(pattern, recursive=True))
+        else:
+            candidates = [pathlib.Path(pattern)]
+        paths.update(
+            path
+            for path in candidates
+            if path.is_file() and not path.name.startswith(".")
+        )
+    return sorted(paths)
+
+
+def solve(
+    day: int,
+    path: pathlib.Path,
+    parts: list[int],
+    *,
+    cache: answers.AnswerCache | None = None,
+) -> list[Record]:
+    raw = path.read_text()
+    common = dict(input=str(path), hash=days.input_hash(raw))
+    module = days.load(day)
+    solution = days.folder(day) / "solution.py"
+    records = []
+    for part in parts:
+        answer = None if cache is None else cache.get(solution, raw, part)
+        if answer is not None:
+            records.append(common | dict(part=part, answer=answer, cached=True))
+            continue
+        solver = getattr(module, f"part{part}")
+        start = time.perf_counter()
+        try:
+            answer = bench.call(solver, raw)
+        except Exception as error:
+            trace = traceback.format_exception_only(error)[-1].strip()
+            records.append(common | dict(part=part, error=trace))
+        else:
+            seconds = time.perf_counter() - start
+            records.append(
+                common | dict(part=part, answer=str(answer), seconds=seconds)
+            )
+            if cache is not None:
+                cache.put(solution, raw, part, str(answer))
+    return records
+
+
+def solve_parallel(
+    day: int,
+    paths: list[pathlib.Path],
+    parts: list[int],
+    *,
+    workers: int,
+    cache: answers.AnswerCache | None = None,
+) -> Iterable[Record]:
+    """Yield the records of each input as soon as its worker finishes it."""
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=days.load, initargs=(day,)
+    ) as executor:
+        futures = [
+            executor.submit(solve, day, path, parts, cache=cache) for path in paths
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("day", type=int)
+    parser.add_argument(
+        "inputs", nargs="+", help="input files, directories of them, or globs"
+    )
+    parser.add_argument("--parts", nargs="+", type=int, default=list(days.PARTS))
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        metavar="N",
+        help="solve inputs in N worker processes (default 0, one per CPU)",
+    )
+    parser.add_argument(
+        "--output", "-o", metavar="PATH", help="write the JSON lines here, not stdout"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="solve every input, rather than reuse cached answers",
+    )
+    args = parser.parse_args(argv)
+    if args.day not in days.DAYS:
+        parser.error(f"no such day: {args.day}")
+    for part in args.parts:
+        if part not in days.PARTS:
+            parser.error(f"no such part: {part}")
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    return args
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
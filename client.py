@@ -0,0 +1,45 @@
+"""
+Solve a day through the solver daemon (see serve.py), with the same usage and
+output as running its solution directly:
+
+    python client.py 12 1 2 < input    # as python 12/solution.py 1 2 < input
+
+If no daemon is listening, the parts are solved in this process instead.
+"""
+
+import sys
+import pathlib
+import argparse
+
+from aoc import days, daemon
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+    raw = sys.stdin.read()
+    try:
+        response = daemon.ask(args.day, args.parts, raw, path=args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        response = daemon.solve(args.day, args.parts, raw)
+    if "error" in response:
+        print(response["error"], end="", file=sys.stderr)
+        return 1
+    # in the order the solution itself prints them, whatever the order asked
+    for part in days.PARTS:
+        if part in args.parts:
+            print(f"Part {part}: {response['answers'][str(part)]}")
+    return 0
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(usage="%(prog)s day [1] [2] [options] < input")
+    parser.add_argument("day", type=int, choices=days.DAYS, metavar="day")
+    parser.add_argument("parts", nargs="*", type=int, choices=days.PARTS)
+    parser.add_argument(
+        "--socket", type=pathlib.Path, default=daemon.SOCKET, metavar="PATH"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
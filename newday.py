@@ -1,32 +1,63 @@
-import os, sys, shutil, pathlib, requests, dotenv
+import os, sys, shutil, argparse, dotenv
+from concurrent.futures import ThreadPoolExecutor
+
+from aoc import days
+from aoc.fetch import BASE_URL, InputFetcher
 
 dotenv.load_dotenv()
 
-ROOT = pathlib.Path(__file__).parent
+ROOT = days.ROOT
 TEMPLATE = ROOT / 'template.py'
 TOKEN = os.getenv('TOKEN')
+YEAR = 2023
 
 assert TOKEN is not None
 
 def main():
-    day = int(sys.argv[1])
-    folder = ROOT / f"{day:02}"
-    if folder.exists():
+    parser = argparse.ArgumentParser(description='set up a day and fetch its input')
+    which = parser.add_mutually_exclusive_group(required=True)
+    which.add_argument('day', nargs='?', type=int)
+    which.add_argument('--all', action='store_true', help='fill in every missing day')
+    parser.add_argument('--refresh', action='store_true', help='ignore cached inputs')
+    parser.add_argument('--base-url', default=os.getenv('AOC_BASE_URL', BASE_URL))
+    args = parser.parse_args()
+    with InputFetcher(TOKEN, base_url=args.base_url) as fetcher:
+        if args.all:
+            return fill_all(fetcher, refresh=args.refresh)
+        return new_day(fetcher, args.day, refresh=args.refresh)
+
+def new_day(fetcher: InputFetcher, day: int, *, refresh: bool = False) -> int:
+    folder = days.folder(day)
+    if folder.exists() and not refresh:
         print(f'day {day:02} already exists', file=sys.stderr)
         return 1
-    folder.mkdir()
-    shutil.copy(TEMPLATE, folder / 'solution.py')
-    (folder / 'example').touch()
-    (folder / 'input').write_text(get_input(2023, day))
+    create(day)
+    days.input_path(day).write_text(fetcher.get(YEAR, day, refresh=refresh))
     return 0
 
-def get_input(year: int, day: int) -> str:
-    response = requests.get(
-        f'https://adventofcode.com/{year}/day/{day}/input',
-        cookies=dict(session=TOKEN),
-    )
-    response.raise_for_status()
-    return response.text
+def fill_all(fetcher: InputFetcher, *, refresh: bool = False) -> int:
+    missing = [day for day in days.DAYS if refresh or not days.input_path(day).exists()]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        texts = {day: executor.submit(fetcher.get, YEAR, day, refresh=refresh) for day in missing}
+    status = 0
+    for day, text in texts.items():
+        try:
+            result = text.result()
+        except Exception as error:
+            print(f'day {day:02}: {error}', file=sys.stderr)
+            status = 1
+            continue
+        create(day)
+        days.input_path(day).write_text(result)
+    return status
+
+def create(day: int):
+    folder = days.folder(day)
+    folder.mkdir(exist_ok=True)
+    if not (folder / 'solution.py').exists():
+        shutil.copy(TEMPLATE, folder / 'solution.py')
+    if not (folder / 'example').exists():
+        (folder / 'example').touch()
 
 if __name__ == '__main__':
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Check every day's answers and run times on its example files and on small
+synthetic inputs (see aoc/synth.py), and the time to import each solution,
+against those recorded in baseline.json.
+
+    python regression.py                   # every day
+    python regression.py 12 16             # selected days
+    python regression.py --tolerance 10    # fail parts over 10% slower
+    python regression.py --update          # record the current answers and times
+
+A part fails if its answer differs from the baseline, if it raises, or if its
+best time is more than `--tolerance` percent (and `--min-delta` seconds) over
+the baseline's, and an import fails on the same terms for its time. Parts
+missing from the baseline are reported but don't fail; neither do parts that
+raise while updating, such as a part 1 on an example written only for part 2.
+
+For a day with `running_totals(lines)`, which yields every part's answer so
+far after each line, those are also checked against the parts themselves run
+on the lines so far.
+"""
+
+import sys
+import json
+import time
+import argparse
+import traceback
+from dataclasses import dataclass
+
+from aoc import days, bench, imports, synth
+
+BASELINE = days.ROOT / "baseline.json"
+
+
+@dataclass
+class Case:
+    day: int
+    name: str
+    raw: str
+
+
+@dataclass
+class Outcome:
+    answer: str | None
+    seconds: float | None
+    error: str | None = None
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+    baseline = load_baseline()
+    failures = 0
+    for day in args.days:
+        name = f"{day:02}/solution.py"
+        seconds = min(imports.import_time(day).seconds for _ in range(args.repeat))
+        expected = baseline.get(name, {}).get("import")
+        if args.update:
+            baseline[name] = {"import": dict(seconds=seconds)}
+            status = f"recorded  {bench.format_seconds(seconds)}"
+        elif expected is None:
+            status = f"not in baseline  {bench.format_seconds(seconds)}"
+        else:
+            status = judge_seconds(
+                seconds, expected["seconds"], args.tolerance, args.min_delta
+            )
+            failures += status.startswith("FAIL")
+        print(f"{name:<24} import  {status}", flush=True)
+    for case in cases(args.days):
+        module = days.load(case.day)
+        expected_parts = baseline.get(case.name, {})
+        for part in days.PARTS:
+            outcome = run(getattr(module, f"part{part}"), case.raw, args.repeat)
+            expected = expected_parts.get(str(part))
+            if args.update:
+                status = update(baseline, case, part, outcome)
+            else:
+                status = judge(outcome, expected, args.tolerance, args.min_delta)
+                failures += status.startswith("FAIL")
+            print(f"{case.name:<24} part {part}  {status}", flush=True)
+        if hasattr(module, "running_totals") and not args.update:
+            status = check_running_totals(module, case.raw)
+            failures += status.startswith("FAIL")
+            print(f"{case.name:<24} running  {status}", flush=True)
+    if args.update:
+        save_baseline(baseline)
+        print(f"baseline written to {BASELINE}")
+    elif failures:
+        print(f"{failures} failed parts")
+    return 1 if failures else 0
+
+
+def cases(selected: list[int]) -> list[Case]:
+    found = []
+    for day in selected:
+        for path in days.example_paths(day):
+            found.append(Case(day, str(path.relative_to(days.ROOT)), path.read_text()))
+        if day in synth.SYNTHESISERS:
+            size = synth.SYNTHESISERS[day].sizes[0]
+            raw = synth.generate(day, size)
+            found.append(Case(day, f"synth/{day:02}/{size}", raw))
+    return found
+
+
+def run(solver: bench.Solver, raw: str, repeat: int) -> Outcome:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            answer = bench.call(solver, raw)
+        except Exception as error:
+            trace = traceback.format_exception_only(error)[-1].strip()
+            return Outcome(None, None, trace)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return Outcome(str(answer), best)
+
+
+def check_running_totals(module, raw: str) -> str:
+    lines = raw.splitlines()
+    for count, totals in enumerate(module.running_totals(lines), 1):
+        so_far = "".join(f"{line}\n" for line in lines[:count])
+        expected = [
+            str(bench.call(getattr(module, f"part{part}"), so_far))
+            for part in days.PARTS
+        ]
+        answers = list(map(str, totals))
+        if answers != expected:
+            return f"FAIL after line {count}: {answers}, expected {expected}"
+    return f"ok  after each of {len(lines)} lines"
+
+
+def judge(
+    outcome: Outcome, expected: dict | None, tolerance: float, min_delta: float
+) -> str:
+    if outcome.error is not None:
+        if expected is None:
+            return f"not in baseline  ({outcome.error})"
+        return f"FAIL raised {outcome.error}"
+    assert outcome.seconds is not None
+    if expected is None:
+        took = bench.format_seconds(outcome.seconds)
+        return f"not in baseline  {outcome.answer}  {took}"
+    if outcome.answer != expected["answer"]:
+        return f"FAIL answer {outcome.answer}, expected {expected['answer']}"
+    return judge_seconds(outcome.seconds, expected["seconds"], tolerance, min_delta)
+
+
+def judge_seconds(
+    seconds: float, expected: float, tolerance: float, min_delta: float
+) -> str:
+    limit = expected * (1 + tolerance / 100)
+    change = (seconds / expected - 1) * 100
+    summary = f"{bench.format_seconds(seconds)} ({change:+.0f}%)"
+    if seconds > limit and seconds - expected > min_delta:
+        return f"FAIL slower  {summary}"
+    return f"ok  {summary}"
+
+
+def update(baseline: dict, case: Case, part: int, outcome: Outcome) -> str:
+    parts = baseline.setdefault(case.name, {})
+    if outcome.error is not None:
+        parts.pop(str(part), None)
+        return f"left out  ({outcome.error})"
+    parts[str(part)] = dict(answer=outcome.answer, seconds=outcome.seconds)
+    assert outcome.seconds is not None
+    return f"recorded  {outcome.answer}  {bench.format_seconds(outcome.seconds)}"
+
+
+def load_baseline() -> dict[str, dict[str, dict]]:
+    """
+    {case name: {part: {"answer": str, "seconds": float}}}, and for each
+    solution, {"NN/solution.py": {"import": {"seconds": float}}}.
+    """
+    if not BASELINE.exists():
+        return {}
+    with open(BASELINE) as file:
+        return json.load(file)
+
+
+def save_baseline(baseline: dict):
+    document = {name: parts for name, parts in sorted(baseline.items()) if parts}
+    with open(BASELINE, "w") as file:
+        json.dump(document, file, indent=2, ensure_ascii=False)
+        file.write("\n")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("days", nargs="*", type=int, default=list(days.DAYS))
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=25,
+        metavar="PERCENT",
+        help="how much slower than the baseline a part may be (default 25)",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.005,
+        metavar="SECONDS",
+        help="ignore slowdowns smaller than this, as timer noise (default 0.005)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, metavar="N", help="time the best of N runs"
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="record the current answers and times as the baseline",
+    )
+    args = parser.parse_args(argv)
+    for day in args.days:
+        if day not in days.DAYS:
+            parser.error(f"no such day: {day}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    return args
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,174 @@
+"""
+Run the daily solutions in-process against their cached `NN/input` files and
+report wall time, CPU time and peak traced memory for every part.
+
+    python run.py                      # every day with an input
+    python run.py 12 16 --repeat 5     # selected days, best of five
+    python run.py --json results.json  # also write machine-readable results
+    python run.py --jobs 0             # one worker process per CPU
+    python run.py --memory-top 5       # where each part's peak was allocated
+    python run.py --memory-budget 512  # fail parts that allocate over 512 MiB
+    python run.py --import-time        # also time importing each solution
+"""
+
+import os
+import sys
+import json
+import math
+import argparse
+from dataclasses import asdict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc import days, bench, memory, imports
+
+type Job = tuple[int, int]
+type Outcome = bench.Measurement | memory.MemoryBudgetExceeded
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+    import_times = []
+    if args.import_time:
+        for day in args.days:
+            timing = imports.import_time(day)
+            print(imports.format_row(timing), flush=True)
+            import_times.append(timing)
+    jobs = []
+    for day in args.days:
+        if not days.input_path(day).exists():
+            print(f"day {day:02}: no input at {days.input_path(day)}", file=sys.stderr)
+            continue
+        jobs.extend((day, part) for part in args.parts)
+    options = dict(
+        warmup=args.warmup,
+        repeat=args.repeat,
+        memory_top=args.memory_top,
+        memory_budget=args.memory_budget and args.memory_budget * memory.MiB,
+    )
+    if args.jobs == 1:
+        outcomes = run_serial(jobs, **options)
+    else:
+        outcomes = run_parallel(jobs, workers=args.jobs or os.cpu_count(), **options)
+    results = []
+    failures = []
+    for (day, part), outcome in outcomes:
+        if isinstance(outcome, memory.MemoryBudgetExceeded):
+            print(
+                f"day {day:02} part {part}  over memory budget: {outcome}", flush=True
+            )
+            failures.append(dict(day=day, part=part, error=str(outcome)))
+            continue
+        print(bench.format_row(outcome), flush=True)
+        if outcome.sites:
+            print(bench.format_sites(outcome), flush=True)
+        results.append(outcome)
+    bench.save_timings(results)
+    if args.json is not None:
+        write_json(args.json, args, results, failures, import_times)
+    return 1 if failures else 0
+
+
+def run_serial(jobs: list[Job], **kwargs) -> Iterable[tuple[Job, Outcome]]:
+    for job in jobs:
+        yield job, attempt(*job, **kwargs)
+
+
+def attempt(day: int, part: int, **kwargs) -> Outcome:
+    try:
+        return bench.measure_part(day, part, **kwargs)
+    except memory.MemoryBudgetExceeded as error:
+        return error
+
+
+def run_parallel(
+    jobs: list[Job], *, workers: int, **kwargs
+) -> Iterable[tuple[Job, Outcome]]:
+    """
+    Measure every job in its own worker process, starting the slowest jobs of
+    the previous run first (and jobs that have never been timed before those),
+    but yield the results in the order of `jobs` as soon as that is possible.
+    """
+    timings = bench.load_timings()
+    longest_first = sorted(jobs, key=lambda job: -timings.get(job, math.inf))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(attempt, *job, **kwargs): job for job in longest_first
+        }
+        finished = {}
+        remaining = iter(jobs)
+        next_job = next(remaining, None)
+        for future in as_completed(futures):
+            finished[futures[future]] = future.result()
+            while next_job in finished:
+                yield next_job, finished.pop(next_job)
+                next_job = next(remaining, None)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("days", nargs="*", type=int, default=list(days.DAYS))
+    parser.add_argument("--parts", nargs="+", type=int, default=list(days.PARTS))
+    parser.add_argument("--warmup", type=int, default=0, metavar="N")
+    parser.add_argument("--repeat", type=int, default=1, metavar="N")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="measure parts in N worker processes (0 for one per CPU)",
+    )
+    parser.add_argument(
+        "--memory-top",
+        type=int,
+        default=0,
+        metavar="N",
+        help="report the N largest allocation sites near each part's peak",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        metavar="MiB",
+        help="fail any part whose traced allocations exceed this",
+    )
+    parser.add_argument(
+        "--import-time",
+        action="store_true",
+        help="time importing each solution in a fresh interpreter",
+    )
+    args = parser.parse_args(argv)
+    for day in args.days:
+        if day not in days.DAYS:
+            parser.error(f"no such day: {day}")
+    for part in args.parts:
+        if part not in days.PARTS:
+            parser.error(f"no such part: {part}")
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    return args
+
+
+def write_json(
+    path: str,
+    args: argparse.Namespace,
+    results: list[bench.Measurement],
+    failures: list[dict],
+    import_times: list[imports.ImportTime],
+):
+    document = dict(
+        warmup=args.warmup,
+        repeat=args.repeat,
+        memory_budget=args.memory_budget,
+        results=[result.to_json() for result in results],
+        failures=failures,
+        import_times=[asdict(timing) for timing in import_times],
+    )
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+        file.write("\n")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
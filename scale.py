@@ -0,0 +1,136 @@
+"""
+Run the daily solutions on synthetic inputs of growing size (see aoc/synth.py)
+and estimate how their time and peak memory grow with the input.
+
+    python scale.py                         # every day, default sizes
+    python scale.py 12 16 --repeat 3        # selected days, best of three
+    python scale.py 11 --sizes 100 200 400  # sizes of your own
+    python scale.py --json scaling.json     # also write machine-readable results
+
+The exponent k is the least-squares slope of log(time) against log(input
+bytes), so time grows roughly like bytes**k over the sizes measured.
+"""
+
+import sys
+import json
+import math
+import argparse
+from dataclasses import dataclass
+
+from aoc import days, bench, synth
+
+
+@dataclass
+class Sample:
+    size: int
+    bytes: int
+    measurement: bench.Measurement
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+    document = []
+    for day in args.days:
+        module = days.load(day)
+        sizes = args.sizes or synth.SYNTHESISERS[day].sizes
+        for part in args.parts:
+            solver = getattr(module, f"part{part}")
+            # a first run to import whatever the solver loads lazily, which
+            # would otherwise be charged to the smallest size
+            bench.call(solver, synth.generate(day, min(sizes), seed=args.seed))
+            samples = []
+            for size in sizes:
+                raw = synth.generate(day, size, seed=args.seed)
+                measurement = bench.measure(day, part, solver, raw, repeat=args.repeat)
+                samples.append(Sample(size, len(raw.encode()), measurement))
+                print(format_sample(samples[-1]), flush=True)
+            time_exponent = growth_exponent(
+                [s.bytes for s in samples], [s.measurement.best_wall for s in samples]
+            )
+            memory_exponent = growth_exponent(
+                [s.bytes for s in samples], [s.measurement.peak for s in samples]
+            )
+            print(
+                f"day {day:02} part {part}  time ~ bytes^{format_exponent(time_exponent)}"
+                f"  memory ~ bytes^{format_exponent(memory_exponent)}",
+                flush=True,
+            )
+            document.append(
+                dict(
+                    day=day,
+                    part=part,
+                    seed=args.seed,
+                    time_exponent=time_exponent,
+                    memory_exponent=memory_exponent,
+                    samples=[
+                        dict(
+                            size=s.size,
+                            bytes=s.bytes,
+                            best_wall=s.measurement.best_wall,
+                            peak=s.measurement.peak,
+                            answer=s.measurement.answer,
+                        )
+                        for s in samples
+                    ],
+                )
+            )
+    if args.json is not None:
+        with open(args.json, "w") as file:
+            json.dump(document, file, indent=2)
+            file.write("\n")
+
+
+def growth_exponent(xs: list[float], ys: list[float]) -> float | None:
+    """The slope of the least-squares line through (log x, log y)."""
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x > 0 and y > 0]
+    if len({x for x, _ in points}) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return covariance / variance
+
+
+def format_sample(sample: Sample) -> str:
+    m = sample.measurement
+    return (
+        f"day {m.day:02} part {m.part}  size {sample.size:>7}  "
+        f"{bench.format_bytes(sample.bytes):>9}  "
+        f"wall {bench.format_seconds(m.best_wall):>9}  "
+        f"peak {bench.format_bytes(m.peak):>9}"
+    )
+
+
+def format_exponent(exponent: float | None) -> str:
+    return "?" if exponent is None else f"{exponent:.2f}"
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("days", nargs="*", type=int, default=sorted(synth.SYNTHESISERS))
+    parser.add_argument("--parts", nargs="+", type=int, default=list(days.PARTS))
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        metavar="N",
+        help="generator sizes to sweep instead of each day's defaults",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, metavar="N")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    args = parser.parse_args(argv)
+    for day in args.days:
+        if day not in synth.SYNTHESISERS:
+            parser.error(f"no generator for day {day}")
+    for part in args.parts:
+        if part not in days.PARTS:
+            parser.error(f"no such part: {part}")
+    if args.sizes and min(args.sizes) < 1:
+        parser.error("sizes must be positive")
+    return args
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,137 @@
+"""
+Start the solver daemon: worker processes with every solution already
+imported, answering requests on a Unix socket (see aoc/daemon.py for the
+protocol, and client.py).
+
+    python serve.py                    # one worker per CPU
+    python serve.py --jobs 4 --socket /tmp/aoc.sock
+"""
+
+import os
+import sys
+import signal
+import socket
+import pathlib
+import argparse
+import threading
+import contextlib
+import socketserver
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from aoc import days, daemon
+
+
+class Handler(socketserver.BaseRequestHandler):
+    server: "Server"
+
+    def handle(self):
+        try:
+            request = daemon.receive(self.request)
+            day, parts, raw = request["day"], request["parts"], request["input"]
+            if not (
+                isinstance(day, int)
+                and isinstance(parts, list)
+                and all(isinstance(part, int) for part in parts)
+                and isinstance(raw, str)
+            ):
+                raise TypeError(
+                    "day must be an int, parts a list of ints, input a string"
+                )
+        except (ConnectionError, ValueError, KeyError, TypeError) as error:
+            daemon.send(self.request, dict(error=f"bad request: {error!r}"))
+            return
+        if day not in days.DAYS or not set(parts) <= set(days.PARTS):
+            daemon.send(self.request, dict(error=f"no such day or part: {day} {parts}"))
+            return
+        executor = self.server.executor
+        try:
+            response = executor.submit(daemon.solve, day, parts, raw).result()
+        except BrokenProcessPool as error:
+            # a worker died, taking the pool with it, so start a fresh one
+            self.server.replace(executor)
+            response = dict(error=f"worker crashed: {error}")
+        daemon.send(self.request, response)
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: pathlib.Path, workers: int):
+        self.workers = workers
+        self.executor = start_workers(workers)
+        self.lock = threading.Lock()
+        super().__init__(str(path), Handler)
+
+    def replace(self, broken: ProcessPoolExecutor):
+        """Swap in a new pool for `broken`, unless another request already has."""
+        with self.lock:
+            if self.executor is broken:
+                self.executor = start_workers(self.workers)
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+
+
+def start_workers(workers: int) -> ProcessPoolExecutor:
+    # forkserver rather than fork, because the server's threads start workers
+    context = multiprocessing.get_context("forkserver")
+    executor = ProcessPoolExecutor(
+        workers, mp_context=context, initializer=daemon.preload
+    )
+    # start every worker, and so import everything, before taking requests
+    list(executor.map(int, range(workers)))
+    return executor
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+    if args.socket.exists():
+        with contextlib.suppress(ConnectionRefusedError, FileNotFoundError):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(str(args.socket))
+                print(
+                    f"a daemon is already listening on {args.socket}", file=sys.stderr
+                )
+                return 1
+        # left behind by a daemon that didn't shut down cleanly
+        args.socket.unlink()
+    args.socket.parent.mkdir(parents=True, exist_ok=True)
+    workers = args.jobs or os.cpu_count() or 1
+    # exit through the clean-up below, which removes the socket
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    with Server(args.socket, workers) as server:
+        print(f"listening on {args.socket} with {workers} workers", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            args.socket.unlink()
+    return 0
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--socket", type=pathlib.Path, default=daemon.SOCKET, metavar="PATH"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        metavar="N",
+        help="worker processes (default 0, one per CPU)",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    return args
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
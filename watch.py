@@ -0,0 +1,154 @@
+"""
+Watch the daily solutions for edits and, whenever one is saved, reload just
+that day in this process, rerun it on its input and examples, and print how
+its answers and timings compare with before the edit. The "before" of each
+day is timed in the idle moments between edits, one day at a time, so a day
+edited before its turn has only the answers after the edit to show.
+
+    python watch.py              # every day
+    python watch.py 12 16        # selected days
+    python watch.py 12 --repeat 10 --interval 0.2
+"""
+
+import sys
+import time
+import argparse
+import traceback
+from dataclasses import dataclass
+
+from aoc import days, bench
+
+type Key = tuple[str, int]  # input name, part
+
+
+@dataclass
+class Result:
+    answer: str
+    seconds: float | None  # None if the part raised, with the error as the answer
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+    mtimes = {day: mtime(day) for day in args.days}
+    # days whose "before" is still to be timed, which is done while idle
+    untimed = [day for day in args.days if load(day)]
+    # results of the last run of each day, the "before" for its next edit
+    previous: dict[int, dict[Key, Result]] = {}
+    print(f"watching {len(args.days)} days; ctrl-c to stop", flush=True)
+    try:
+        while True:
+            time.sleep(args.interval)
+            edited = False
+            for day in args.days:
+                modified = mtime(day)
+                if modified == mtimes[day]:
+                    continue
+                mtimes[day] = modified
+                edited = True
+                if day in untimed:
+                    # too late to time the code from before this edit
+                    untimed.remove(day)
+                start = time.perf_counter()
+                try:
+                    days.reload(day)
+                except Exception:
+                    print(f"day {day:02}: reload failed", file=sys.stderr)
+                    traceback.print_exc()
+                    continue
+                took = bench.format_seconds(time.perf_counter() - start)
+                print(f"day {day:02}: reloaded in {took}", flush=True)
+                after = run(day, args.parts, args.repeat)
+                before = previous.get(day, {})
+                for key, result in after.items():
+                    print(format_change(key, before.get(key), result))
+                previous[day] = after
+            if untimed and not edited:
+                day = untimed.pop(0)
+                previous[day] = run(day, args.parts, args.repeat)
+    except KeyboardInterrupt:
+        return 0
+
+
+def load(day: int) -> bool:
+    """Import a day, reporting rather than raising if it fails."""
+    try:
+        days.load(day)
+    except Exception:
+        print(f"day {day:02}: import failed; watching for a fix", file=sys.stderr)
+        traceback.print_exc()
+        return False
+    return True
+
+
+def mtime(day: int) -> int:
+    return (days.folder(day) / "solution.py").stat().st_mtime_ns
+
+
+def run(day: int, parts: list[int], repeat: int) -> dict[Key, Result]:
+    module = days.load(day)
+    inputs = list(days.example_paths(day))
+    if days.input_path(day).exists():
+        inputs.append(days.input_path(day))
+    results = {}
+    for path in inputs:
+        raw = path.read_text()
+        for part in parts:
+            solver = getattr(module, f"part{part}")
+            try:
+                answer, samples = bench.sample(solver, raw, repeat=repeat)
+            except Exception as error:
+                error_line = traceback.format_exception_only(error)[-1].strip()
+                results[path.name, part] = Result(error_line, None)
+            else:
+                results[path.name, part] = Result(str(answer), min(samples))
+    return results
+
+
+def format_change(key: Key, before: Result | None, after: Result) -> str:
+    name, part = key
+    line = f"    {name:<10} part {part}  "
+    if before is None:
+        before = Result("-", None)
+    if before.answer == after.answer:
+        line += f"{after.answer:>20}  "
+    else:
+        line += f"{before.answer} -> {after.answer}  (answer changed)  "
+    if before.seconds is not None and after.seconds is not None:
+        change = (after.seconds / before.seconds - 1) * 100
+        line += (
+            f"{bench.format_seconds(before.seconds):>9} -> "
+            f"{bench.format_seconds(after.seconds):>9}  ({change:+.0f}%)"
+        )
+    elif after.seconds is not None:
+        line += f"{bench.format_seconds(after.seconds):>9}"
+    return line
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("days", nargs="*", type=int, default=list(days.DAYS))
+    parser.add_argument("--parts", nargs="+", type=int, default=list(days.PARTS))
+    parser.add_argument(
+        "--repeat", type=int, default=3, metavar="N", help="time the best of N runs"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        metavar="SECONDS",
+        help="how often to check for edits",
+    )
+    args = parser.parse_args(argv)
+    for day in args.days:
+        if day not in days.DAYS:
+            parser.error(f"no such day: {day}")
+    for part in args.parts:
+        if part not in days.PARTS:
+            parser.error(f"no such part: {part}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    return args
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())